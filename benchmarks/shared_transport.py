@@ -0,0 +1,206 @@
+"""
+공유 커넥션 풀 벤치마크
+
+로컬 대역 서버(NICE, 요청자 페이지 흉내)에 PASS 앱 본인인증 흐름을 반복 실행하고,
+인증 1건당 새로 맺은 TCP 연결 수(= TLS 환경에서의 핸드셰이크 수)를 비교합니다.
+
+- per-instance: 세션마다 새 커넥션 풀 사용 (transport 미지정 시 기본 동작과 동일)
+- shared: create_shared_transport()로 만든 커넥션 풀 하나를 모든 세션이 공유
+
+Usage:
+    python benchmarks/shared_transport.py [--verifications 200] [--concurrency 20]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pass_nice import PASS_NICE, create_shared_transport  # noqa: E402
+
+REQUESTER_PAGE = """<html><form>
+<input type="hidden" name="m" value="checkplusService">
+<input type="hidden" name="EncodeData" value="ENCDATA">
+</form></html>"""
+
+DECRYPT_PAGE = """<script>
+form1.NICE_NAME.value = '홍길동';
+form1.NICE_GENDER.value = '1';
+form1.NICE_BIRTHEDATE.value = '20000101';
+form1.NICE_MOBILENO.value = '01012345678';
+</script>"""
+
+
+class StandInServer:
+    """NICE 본인인증 흐름을 흉내 내는 HTTP/1.1 keep-alive 서버 (TCP 연결 수를 기록합니다.)"""
+
+    def __init__(self):
+        self.connections = 0
+        self.requests = 0
+        self._server = None
+
+    @property
+    def port(self) -> int:
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    def reset(self) -> None:
+        self.connections = self.requests = 0
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while True:
+                head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+                _, target, _ = head[0].split(" ", 2)
+                headers = dict(line.split(":", 1) for line in head[1:] if line)
+                headers = {name.lower(): value.strip() for name, value in headers.items()}
+
+                length = int(headers.get("content-length", 0))
+                if length:
+                    await reader.readexactly(length)
+
+                self.requests += 1
+                path, _, query = target.partition("?")
+                content_type, body, extra = self._route(headers.get("host", ""), path, query)
+
+                writer.write(
+                    f"HTTP/1.1 200 OK\r\ncontent-type: {content_type}\r\ncontent-length: {len(body)}\r\n{extra}\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+
+        finally:
+            writer.close()
+
+    def _route(self, host: str, path: str, query: str) -> tuple[str, bytes, str]:
+        html, js = "text/html; charset=utf-8", "application/json"
+
+        if host.startswith("www.ex.co.kr"):
+            return html, (DECRYPT_PAGE if query else REQUESTER_PAGE).encode(), ""
+
+        if path == "/CheckPlusSafeModel/checkplus.cb":
+            return html, b'const SERVICE_INFO = "SVC";', "set-cookie: JSESSIONID=SESSION; Path=/\r\n"
+
+        if path == "/cert/mobileCert/method":
+            return html, b'<input type="hidden" name="certInfoHash" value="HASH">', ""
+
+        if path.endswith("/certification"):
+            return html, b'const captchaVersion = "CAP";', ""
+
+        if path.endswith("/certification/proc"):
+            return js, json.dumps({"code": "SUCCESS"}).encode(), ""
+
+        if path == "/cert/polling/confirm/check/proc":
+            return js, json.dumps({"code": "0000"}).encode(), ""
+
+        if path == "/cert/result/send":
+            return html, b'const queryString = "EncodeData=RESULT";', ""
+
+        return html, b"ok", ""
+
+
+class LocalRedirectTransport(httpx.AsyncBaseTransport):
+    """요청 URL은 그대로 두고(Host 헤더, 쿠키 도메인 유지), 실제 연결만 로컬 대역 서버로 보냅니다."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, port: int):
+        self._transport = transport
+        self._port = port
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        local_request = httpx.Request(
+            request.method, request.url.copy_with(scheme="http", host="127.0.0.1", port=self._port),
+            headers=request.headers, stream=request.stream, extensions=request.extensions
+        )
+        return await self._transport.handle_async_request(local_request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+async def verify(transport: httpx.AsyncBaseTransport) -> None:
+    """PASS 앱 본인인증 1건 (세션 초기화 -> 인증 요청 전송 -> 완료 확인)"""
+    async with PASS_NICE("SK", transport=transport) as session:
+        await session.init_session("app_push")
+        await session.send_push_verification("홍길동", "01012345678", "123456")
+
+        result = await session.check_push_verification()
+        assert result.status, result.message
+
+
+async def run_mode(server: StandInServer, mode: str, verifications: int, concurrency: int) -> dict:
+    server.reset()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    shared = LocalRedirectTransport(create_shared_transport(), server.port) if mode == "shared" else None
+
+    async def one() -> None:
+        async with semaphore:
+            if shared is not None:
+                await verify(shared)
+                return
+
+            transport = LocalRedirectTransport(httpx.AsyncHTTPTransport(), server.port)
+            try:
+                await verify(transport)
+
+            finally:
+                await transport.aclose()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(verifications)))
+    elapsed = time.perf_counter() - started
+
+    if shared is not None:
+        await shared.aclose()
+
+    return {
+        "mode": mode,
+        "requests": server.requests,
+        "connections": server.connections,
+        "per_verification": server.connections / verifications,
+        "ms_per_verification": elapsed * 1000 / verifications,
+    }
+
+
+async def main(verifications: int, concurrency: int) -> None:
+    server = StandInServer()
+    await server.start()
+
+    try:
+        print(f"{verifications} verifications, concurrency {concurrency}")
+        print(f"{'mode':<14}{'requests':>10}{'connections':>13}{'conn/verif':>12}{'ms/verif':>10}")
+
+        for mode in ("per-instance", "shared"):
+            stats = await run_mode(server, mode, verifications, concurrency)
+            print(
+                f"{stats['mode']:<14}{stats['requests']:>10}{stats['connections']:>13}"
+                f"{stats['per_verification']:>12.2f}{stats['ms_per_verification']:>10.2f}"
+            )
+
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--verifications", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.verifications, args.concurrency))
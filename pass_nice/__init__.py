@@ -15,12 +15,39 @@ __author__ = "Sunrise"
 __email__ = "sunr1s2@proton.me"
 
 from .PASS_NICE import PASS_NICE
-from .types import Result
+from .image import LazyImage
+from .limits import RateLimit, RateLimiter, get_rate_limiter, set_rate_limiter
+from .manager import VerificationManager
+from .polling import PollingScheduler, PollingStrategy
+from .pool import SessionPool
+from .store import MemorySessionStore, SessionManager, SessionStore, SQLiteSessionStore
+from .transport import create_shared_client, create_shared_transport
+from .types import BulkValidationResult, Result, VerificationData, VerificationEvent
+from .validation import validate_many
 
 from .exceptions import *  # noqa: F401,F403
 
 __all__ = [
     "PASS_NICE",
     "Result",
+    "VerificationData",
+    "VerificationEvent",
+    "BulkValidationResult",
+    "LazyImage",
+    "PollingStrategy",
+    "PollingScheduler",
+    "SessionPool",
+    "SessionManager",
+    "SessionStore",
+    "MemorySessionStore",
+    "SQLiteSessionStore",
+    "VerificationManager",
+    "RateLimit",
+    "RateLimiter",
+    "set_rate_limiter",
+    "get_rate_limiter",
+    "create_shared_client",
+    "create_shared_transport",
+    "validate_many",
     "__version__"
 ]
\ No newline at end of file
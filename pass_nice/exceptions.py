@@ -2,6 +2,18 @@
 PASS-NICE 커스텀 예외 클래스들
 """
 
+from typing import Optional
+
+__all__ = [
+    "PassNiceError",
+    "SessionNotInitializedError",
+    "SessionAlreadyInitializedError",
+    "NetworkError",
+    "RateLimitError",
+    "ParseError",
+    "ValidationError",
+]
+
 
 class PassNiceError(Exception):
     """PASS-NICE 모듈의 기본 예외 클래스"""
@@ -29,6 +41,13 @@ class NetworkError(PassNiceError):
         super().__init__(message, error_code)
 
 
+class RateLimitError(NetworkError):
+    """요청 빈도 제한으로 요청이 거절되었을 때 발생하는 예외 (retry_after: 다시 시도할 수 있을 때까지의 시간(초))"""
+    def __init__(self, message: str, error_code: int = 1, retry_after: float = 0.0):
+        super().__init__(message, error_code)
+        self.retry_after = retry_after
+
+
 class ParseError(PassNiceError):
     """데이터 파싱 오류 시 발생하는 예외"""
     def __init__(self, message: str, error_code: int = 2):
@@ -36,6 +55,7 @@ class ParseError(PassNiceError):
 
 
 class ValidationError(PassNiceError):
-    """입력 데이터 검증 오류 시 발생하는 예외"""
-    def __init__(self, message: str, error_code: int = 3):
+    """입력 데이터 검증 오류 시 발생하는 예외 (field: 검증에 실패한 필드명)"""
+    def __init__(self, message: str, error_code: int = 3, field: Optional[str] = None):
         super().__init__(message, error_code)
+        self.field = field
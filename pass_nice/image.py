@@ -0,0 +1,111 @@
+"""
+PASS-NICE 지연 다운로드 이미지 핸들
+"""
+
+from typing import TYPE_CHECKING, AsyncIterator, Generator, Optional
+
+import httpx
+
+from .exceptions import NetworkError
+
+if TYPE_CHECKING:
+    from .PASS_NICE import PASS_NICE
+
+# 스트리밍 시 허용하는 이미지 최대 크기 (캡챠, QR코드 이미지는 수 KB 수준입니다.)
+DEFAULT_MAX_IMAGE_SIZE = 1024 * 1024
+
+
+class LazyImage:
+    """
+    실제로 필요할 때 다운로드되는 NICE 이미지(QR코드 등) 핸들입니다.
+
+    - Notes
+        - `await image` 또는 `await image.fetch()`로 이미지 바이트를 가져옵니다.
+        - 한 번 다운로드한 이미지는 핸들에 보관되어 재요청하지 않습니다.
+        - 이미지를 직접 렌더링하는 경우 `url`만 확인하고 다운로드하지 않아도 됩니다.
+        - `stream()`을 사용하면 이미지를 메모리에 모으지 않고 응답(ASGI, 파일 등)으로 바로 전달할 수 있습니다.
+
+    Examples:
+        >>> result = await <Client>.create_qr_verification(lazy_image=True)
+        >>> qr_content = await result.data
+    """
+
+    def __init__(self, session: "PASS_NICE", url: str, content: Optional[bytes] = None):
+        """
+        Args:
+            session: 이미지를 요청할 세션 객체 (세션 쿠키가 필요합니다.)
+            url: 이미지 URL
+            content: 이미 받아둔 이미지 바이트 데이터 (있을 경우 재요청하지 않습니다.)
+        """
+
+        self.url = url
+        self._session = session
+        self._content = content
+
+    @property
+    def fetched(self) -> bool:
+        """이미지 다운로드 여부를 반환"""
+        return self._content is not None
+
+    async def fetch(self) -> bytes:
+        """이미지를 다운로드하여 반환합니다. (이미 다운로드한 경우 보관된 값을 반환합니다.)
+
+        Raises:
+            NetworkError: 이미지 요청 중 통신에 실패한 경우
+        """
+
+        if self._content is None:
+            try:
+                image_request = await self._session._request("GET", self.url)
+                self._content = image_request.content
+
+            except httpx.RequestError as e:
+                raise NetworkError(f"이미지 확인 중 문제가 발생했습니다: {str(e)}")
+
+        return self._content
+
+    async def stream(
+        self, chunk_size: Optional[int] = None, max_size: int = DEFAULT_MAX_IMAGE_SIZE
+    ) -> AsyncIterator[bytes]:
+        """이미지를 버퍼링하지 않고 NICE 응답에서 바로 청크 단위로 전달합니다.
+
+        이미 다운로드한 이미지는 보관된 값을 한 번에 전달합니다.
+
+        Args:
+            chunk_size: 청크 크기 (바이트, 기본값: 수신된 크기 그대로)
+            max_size: 허용하는 이미지 최대 크기 (바이트)
+
+        Raises:
+            NetworkError: 이미지 요청 중 통신에 실패했거나, 이미지가 최대 크기를 초과한 경우
+
+        Examples:
+            >>> async for chunk in image.stream():
+            ...     await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        """
+
+        if self._content is not None:
+            yield self._content
+            return
+
+        try:
+            async with self._session._stream("GET", self.url) as image_request:
+                content_length = image_request.headers.get("Content-Length", "")
+                if content_length.isdigit() and int(content_length) > max_size:
+                    raise NetworkError(f"이미지 크기가 최대 크기({max_size} bytes)를 초과했습니다.")
+
+                received = 0
+                async for chunk in image_request.aiter_bytes(chunk_size):
+                    received += len(chunk)
+                    if received > max_size:
+                        raise NetworkError(f"이미지 크기가 최대 크기({max_size} bytes)를 초과했습니다.")
+
+                    yield chunk
+
+        except httpx.RequestError as e:
+            raise NetworkError(f"이미지 확인 중 문제가 발생했습니다: {str(e)}")
+
+    def __await__(self) -> Generator[None, None, bytes]:
+        return self.fetch().__await__()
+
+    def __repr__(self) -> str:
+        return f"LazyImage(url={self.url!r}, fetched={self.fetched})"
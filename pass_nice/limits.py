@@ -0,0 +1,276 @@
+"""
+PASS-NICE 업스트림 요청 제한
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Literal, Optional, Union
+
+from .exceptions import RateLimitError
+
+
+class _HostSlot:
+    """호스트별 동시 요청 슬롯 (async with 블록 동안 슬롯을 점유합니다.)"""
+    __slots__ = ("_limiter", "_host")
+
+    def __init__(self, limiter: "_HostLimiter", host: str):
+        self._limiter = limiter
+        self._host = host
+
+    async def __aenter__(self) -> None:
+        await self._limiter.acquire(self._host)
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._limiter.release(self._host)
+
+
+class _NoSlot:
+    """제한이 없는 경우 사용하는 빈 슬롯"""
+    __slots__ = ()
+
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+
+_NO_SLOT = _NoSlot()
+
+
+class _HostLimiter:
+    """
+    업스트림 호스트별 동시 요청 수 제한기입니다.
+
+    - Notes
+        - 제한을 넘는 요청은 호스트별 FIFO 큐에서 대기하며, 슬롯이 반환되면 가장 먼저 대기한 요청에 바로 넘겨줍니다.
+          (새로 들어온 요청이 대기 중인 요청을 앞지르지 않습니다.)
+    """
+
+    def __init__(self, limits: dict[str, int], default_limit: Optional[int] = None):
+        """
+        Args:
+            limits: 호스트별 최대 동시 요청 수 (Ex: {"nice.checkplus.co.kr": 50})
+            default_limit: limits에 없는 호스트의 최대 동시 요청 수 (기본값: 제한 없음)
+        """
+
+        self._limits = dict(limits)
+        self._default_limit = default_limit
+
+        self._in_flight: dict[str, int] = {}
+        self._waiters: dict[str, deque[asyncio.Future]] = {}
+
+    def slot(self, host: str) -> Union[_HostSlot, _NoSlot]:
+        """해당 호스트의 슬롯을 반환합니다. (async with로 사용)"""
+        if self._limits.get(host, self._default_limit) is None:
+            return _NO_SLOT
+
+        return _HostSlot(self, host)
+
+    def in_flight(self, host: Optional[str] = None) -> int:
+        """진행 중인 요청 수를 반환합니다. (host 미지정 시 전체 호스트 합계)"""
+        if host is not None:
+            return self._in_flight.get(host, 0)
+
+        return sum(self._in_flight.values())
+
+    def queue_depth(self, host: Optional[str] = None) -> int:
+        """슬롯을 기다리는 요청 수를 반환합니다. (host 미지정 시 전체 호스트 합계)"""
+        if host is not None:
+            return len(self._waiters.get(host, ()))
+
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    async def acquire(self, host: str) -> None:
+        limit = self._limits.get(host, self._default_limit)
+        if limit is None:
+            return
+
+        waiters = self._waiters.setdefault(host, deque())
+        if not waiters and self._in_flight.get(host, 0) < limit:
+            self._in_flight[host] = self._in_flight.get(host, 0) + 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        waiters.append(future)
+
+        try:
+            await future
+
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 슬롯을 넘겨받은 직후 취소된 경우, 다음 대기 요청에 슬롯을 넘깁니다.
+                self.release(host)
+
+            elif future in waiters: # 취소된 뒤 release()가 먼저 큐에서 꺼냈을 수 있습니다.
+                waiters.remove(future)
+
+            raise
+
+    def release(self, host: str) -> None:
+        if self._limits.get(host, self._default_limit) is None:
+            return
+
+        # 대기 중인 요청이 있다면 진행 중인 요청 수를 줄이지 않고 슬롯을 그대로 넘겨줍니다.
+        waiters = self._waiters.get(host)
+        while waiters:
+            future = waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                return
+
+        self._in_flight[host] -= 1
+
+
+# ----- 토큰 버킷 요청 빈도 제한 ----- #
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    토큰 버킷 요청 빈도 제한을 나타내는 데이터 클래스
+
+    초당 `rate`개의 토큰이 채워지며, 최대 `burst`개까지 쌓입니다. (요청 1회당 토큰 1개 사용)
+    """
+    rate: float  # 초당 허용 요청 수
+    burst: Optional[int] = None  # 순간 최대 요청 수 (기본값: max(1, rate))
+
+    def __post_init__(self) -> None:
+        if not self.rate > 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+
+        if self.burst is not None and not self.burst >= 1:
+            raise ValueError("burst는 1 이상이어야 합니다.")
+
+    @property
+    def capacity(self) -> float:
+        """버킷 최대 토큰 수를 반환"""
+        return float(self.burst) if self.burst is not None else max(1.0, self.rate)
+
+
+class _TokenBucket:
+    """토큰 버킷 (토큰이 부족하면 음수로 예약하여, 예약한 순서대로 대기 시간이 정해집니다.)"""
+    __slots__ = ("rate", "capacity", "tokens", "updated_at")
+
+    def __init__(self, limit: RateLimit):
+        self.rate = limit.rate
+        self.capacity = limit.capacity
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def wait_time(self, now: float) -> float:
+        """토큰을 채운 뒤, 토큰 1개를 사용하기까지 기다려야 하는 시간(초)을 반환"""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """
+    업스트림 엔드포인트별, 호스트별 토큰 버킷 요청 빈도 제한기입니다.
+
+    - 기능
+        - 엔드포인트(URL 경로 접두사)별, 호스트별 제한을 각각 지정할 수 있으며, 요청은 해당하는 모든 제한을 따릅니다.
+        - `policy="wait"`: 토큰이 채워질 때까지 대기한 뒤 요청합니다. (먼저 요청한 순서대로 진행, 대기 중 취소되면 토큰을 돌려줍니다.)
+        - `policy="fail"`: 토큰이 부족하면 대기하지 않고 RateLimitError를 발생시킵니다.
+
+    - Notes
+        - `set_rate_limiter()`로 등록하면 프로세스의 모든 PASS_NICE 객체가 하나의 제한기를 공유합니다.
+        - RateLimitError는 NetworkError의 하위 클래스이므로, PollingScheduler 등은 일시적인 오류로 보고 다시 시도합니다.
+
+    Examples:
+        >>> set_rate_limiter(RateLimiter(
+        ...     endpoint_limits={"/cert/polling/confirm/check/proc": RateLimit(100, burst=20)},
+        ...     host_limits={"nice.checkplus.co.kr": RateLimit(300)},
+        ... ))
+    """
+
+    def __init__(
+        self, endpoint_limits: Optional[dict[str, RateLimit]] = None,
+        host_limits: Optional[dict[str, RateLimit]] = None,
+        policy: Literal["wait", "fail"] = "wait", max_wait: Optional[float] = None
+    ):
+        """
+        Args:
+            endpoint_limits: URL 경로 접두사별 제한 (Ex: {"/cert/captcha/image/": RateLimit(50)}, 여러 개가 해당하면 가장 긴 접두사 적용)
+            host_limits: 호스트별 제한 (Ex: {"nice.checkplus.co.kr": RateLimit(300)})
+            policy: 토큰이 부족한 경우의 처리 방식 ('wait', 'fail')
+            max_wait: policy가 'wait'일 때 최대 대기 시간 (초, 초과할 경우 RateLimitError, 기본값: 제한 없음)
+        """
+
+        if policy not in ("wait", "fail"):
+            raise ValueError("policy는 'wait' 또는 'fail'이어야 합니다.")
+
+        self._policy = policy
+        self._max_wait = 0.0 if policy == "fail" else max_wait
+
+        # 긴 접두사부터 확인합니다.
+        self._endpoint_buckets = sorted(
+            ((prefix, _TokenBucket(limit)) for prefix, limit in (endpoint_limits or {}).items()),
+            key=lambda item: len(item[0]), reverse=True
+        )
+        self._host_buckets = {host: _TokenBucket(limit) for host, limit in (host_limits or {}).items()}
+
+        # 여러 이벤트 루프(스레드)에서 공유될 수 있으므로 버킷 계산은 잠금 안에서 수행합니다.
+        self._lock = threading.Lock()
+
+    async def acquire(self, host: str, path: str) -> None:
+        """요청 1회에 해당하는 토큰을 사용합니다. (policy에 따라 대기하거나 예외를 발생시킵니다.)
+
+        Raises:
+            RateLimitError: policy가 'fail'이고 토큰이 부족하거나, 대기 시간이 max_wait를 초과하는 경우
+        """
+        buckets = []
+
+        host_bucket = self._host_buckets.get(host)
+        if host_bucket is not None:
+            buckets.append(host_bucket)
+
+        for prefix, bucket in self._endpoint_buckets:
+            if path.startswith(prefix):
+                buckets.append(bucket)
+                break
+
+        if not buckets:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            delay = max(bucket.wait_time(now) for bucket in buckets)
+
+            # 제한을 넘는 요청은 토큰을 사용하지 않고 거절합니다.
+            if self._max_wait is not None and delay > self._max_wait:
+                raise RateLimitError(f"{host}{path} 요청 빈도 제한을 초과했습니다.", retry_after=delay)
+
+            for bucket in buckets:
+                bucket.tokens -= 1
+
+        if delay <= 0:
+            return
+
+        try:
+            await asyncio.sleep(delay)
+
+        except asyncio.CancelledError:
+            # 대기 중 취소된 요청은 전송되지 않으므로, 예약한 토큰을 돌려줍니다.
+            with self._lock:
+                for bucket in buckets:
+                    bucket.tokens = min(bucket.capacity, bucket.tokens + 1)
+
+            raise
+
+
+_rate_limiter: Optional[RateLimiter] = None
+
+
+def set_rate_limiter(limiter: Optional[RateLimiter]) -> None:
+    """프로세스의 모든 PASS_NICE 객체가 공유할 요청 빈도 제한기를 등록합니다. (None: 해제)"""
+    global _rate_limiter
+    _rate_limiter = limiter
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """등록된 요청 빈도 제한기를 반환합니다. (없을 경우 None)"""
+    return _rate_limiter
@@ -0,0 +1,144 @@
+"""
+PASS-NICE 본인인증 세션 관리자
+"""
+
+import weakref
+from typing import Awaitable, Callable, Literal, Optional, TypeVar
+
+import httpx
+
+from .PASS_NICE import PASS_NICE
+from .limits import _HostLimiter
+from .transport import create_shared_client
+
+T = TypeVar("T")
+
+# 업스트림 호스트별 기본 최대 동시 요청 수
+DEFAULT_HOST_LIMITS = {
+    "nice.checkplus.co.kr": 50,
+    "www.ex.co.kr": 10,  # 요청업체 페이지 (한국도로교통공사)
+}
+
+
+class VerificationManager:
+    """
+    여러 PASS_NICE 세션을 생성/추적하고, 업스트림 호스트별 동시 요청 수를 제한하는 관리자입니다.
+
+    - 기능
+        - 관리자가 만든 모든 세션은 하나의 공유 클라이언트와 호스트별 동시 요청 제한을 공유합니다.
+        - 제한을 넘는 요청은 호스트별 FIFO 큐에서 대기하며, 먼저 대기한 요청부터 순서대로 진행됩니다.
+        - `queue_depth()`, `in_flight()`로 호스트별 대기/진행 중인 요청 수를 확인할 수 있습니다.
+
+    - Notes
+        - 제한은 세션 단위가 아닌 요청 단위로 적용됩니다. (세션 수와 무관하게 업스트림 연결 수가 일정하게 유지됩니다.)
+        - 추적 중인 세션은 약한 참조로 보관되므로, 사용이 끝난 세션은 별도로 정리하지 않아도 됩니다.
+
+    Examples:
+        >>> async with VerificationManager({"nice.checkplus.co.kr": 30}) as manager:
+        ...     client = manager.create("SK")
+        ...     await client.init_session("sms")
+        ...     print(manager.queue_depth("nice.checkplus.co.kr"))
+    """
+
+    def __init__(
+        self, host_limits: Optional[dict[str, int]] = None, default_host_limit: Optional[int] = None,
+        client: Optional[httpx.AsyncClient] = None
+    ):
+        """
+        Args:
+            host_limits: 호스트별 최대 동시 요청 수 (기본값: DEFAULT_HOST_LIMITS)
+            default_host_limit: host_limits에 없는 호스트의 최대 동시 요청 수 (기본값: 제한 없음)
+            client: 세션들이 공유할 HTTP 클라이언트 (기본값: 내부에서 생성)
+        """
+
+        self._limiter = _HostLimiter(
+            DEFAULT_HOST_LIMITS if host_limits is None else host_limits, default_host_limit
+        )
+        self._sessions: "weakref.WeakSet[PASS_NICE]" = weakref.WeakSet()
+
+        self._owns_client = client is None
+        self.client = client or create_shared_client()
+
+    @property
+    def active(self) -> int:
+        """추적 중인 세션 수를 반환"""
+        return len(self._sessions)
+
+    def create(self, cell_corp: Optional[Literal["SK", "KT", "LG", "SM", "KM", "LM"]] = None) -> PASS_NICE:
+        """공유 클라이언트와 호스트별 동시 요청 제한을 사용하는 세션을 생성합니다.
+
+        Args:
+            cell_corp: 인증 요청 대상자의 통신사 (init_session에서 지정할 수도 있습니다.)
+
+        Returns:
+            PASS_NICE: 관리자가 추적하는 세션 객체
+        """
+        return self.track(PASS_NICE(cell_corp, client=self.client))
+
+    def track(self, session: PASS_NICE) -> PASS_NICE:
+        """외부에서 생성/복원된 세션(Ex: from_state)에 호스트별 동시 요청 제한을 적용하고 추적합니다."""
+        session._host_limiter = self._limiter
+        self._sessions.add(session)
+
+        return session
+
+    def discard(self, session: PASS_NICE) -> None:
+        """세션을 추적 대상에서 제외하고 동시 요청 제한을 해제합니다."""
+        self._sessions.discard(session)
+        if session._host_limiter is self._limiter:
+            session._host_limiter = None
+
+    async def run(
+        self, flow: Callable[[PASS_NICE], Awaitable[T]],
+        cell_corp: Optional[Literal["SK", "KT", "LG", "SM", "KM", "LM"]] = None
+    ) -> T:
+        """새 세션으로 인증 흐름을 실행하고, 완료되면 세션을 추적 대상에서 제외합니다.
+
+        Args:
+            flow: 세션을 받아 인증을 진행하는 코루틴 함수
+            cell_corp: 인증 요청 대상자의 통신사
+
+        Returns:
+            T: flow의 반환값
+
+        Examples:
+            >>> async def flow(client):
+            ...     await client.init_session("app_push")
+            ...     return await client.send_push_verification("홍길동", "01012345678", "123456")
+            >>> results = await asyncio.gather(*(manager.run(flow, "SK") for _ in range(1000)))
+        """
+        session = self.create(cell_corp)
+
+        try:
+            return await flow(session)
+
+        finally:
+            self.discard(session)
+            await session.close()
+
+    def in_flight(self, host: Optional[str] = None) -> int:
+        """진행 중인 업스트림 요청 수를 반환합니다. (host 미지정 시 전체 호스트 합계)"""
+        return self._limiter.in_flight(host)
+
+    def queue_depth(self, host: Optional[str] = None) -> int:
+        """동시 요청 제한으로 대기 중인 업스트림 요청 수를 반환합니다. (host 미지정 시 전체 호스트 합계)"""
+        return self._limiter.queue_depth(host)
+
+    async def close(self) -> None:
+        """추적 중인 세션과 HTTP 클라이언트를 종료합니다."""
+        for session in list(self._sessions):
+            await session.close()
+
+        self._sessions.clear()
+
+        if self._owns_client:
+            await self.client.aclose()
+
+    # ----- context manager ----- #
+    async def __aenter__(self):
+        """async with 구문 지원"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """async with 구문 지원"""
+        await self.close()
@@ -0,0 +1,263 @@
+"""
+PASS-NICE PASS 앱 인증 완료 여부 확인(polling) 간격 정의 및 스케줄러
+"""
+
+import asyncio
+import heapq
+import itertools
+import random
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from .exceptions import NetworkError
+from .types import Result, VerificationData
+
+if TYPE_CHECKING:
+    from .PASS_NICE import PASS_NICE
+
+
+@dataclass(frozen=True)
+class PollingStrategy:
+    """
+    PASS 앱(알림, QR) 인증 완료 여부를 확인하는 간격을 나타내는 데이터 클래스
+
+    처음 `fast_attempts`번은 `initial_interval` 간격으로 빠르게 확인하고,
+    이후에는 `multiplier`배씩 간격을 늘려 `max_interval`까지 천천히 확인합니다.
+    (대부분의 유저가 인증을 마치는 초반에는 지연 없이, 이후에는 요청 수를 줄입니다.)
+    """
+    initial_interval: float = 1.0
+    max_interval: float = 5.0
+    multiplier: float = 1.5
+    fast_attempts: int = 10
+    jitter: float = 0.1 # 간격 대비 무작위 편차 비율 (동시에 시작된 세션들의 요청 분산)
+
+    def interval(self, attempt: int) -> float:
+        """attempt번째(0부터 시작) 확인 이후 대기할 시간(초)을 반환"""
+        slow_attempts = max(0, attempt - self.fast_attempts + 1)
+        interval = min(self.max_interval, self.initial_interval * self.multiplier ** slow_attempts)
+
+        if self.jitter:
+            interval *= 1 + random.uniform(-self.jitter, self.jitter)
+
+        return interval
+
+
+class _PendingSession:
+    """스케줄러가 관리하는 인증 대기 세션"""
+    __slots__ = ("session", "future", "deadline_at", "attempt")
+
+    def __init__(self, session: "PASS_NICE", future: "asyncio.Future[Result[VerificationData]]", deadline_at: float):
+        self.session = session
+        self.future = future
+        self.deadline_at = deadline_at
+        self.attempt = 0
+
+
+class PollingScheduler:
+    """
+    여러 PASS 앱(알림, QR) 인증 대기 세션의 완료 여부 확인을 하나의 작업에서 관리하는 스케줄러입니다.
+
+    - 기능
+        - 세션별 다음 확인 시각을 힙으로 관리하여, 세션 수와 무관하게 하나의 작업만 대기합니다.
+        - 동시에 진행되는 확인 요청 수를 `max_in_flight`로 제한합니다.
+        - `max_polls_per_second` 지정 시 확인 요청을 일정 간격으로 분산하여 전송합니다.
+        - 인증이 완료되면(응답 코드 `0000`) 세션별 Future에 결과를 전달합니다.
+
+    - Notes
+        - 확인 중 발생한 NetworkError는 일시적인 오류로 보고 다음 확인 시각에 다시 시도합니다.
+        - 그 외 예외는 해당 세션의 Future에 그대로 전달됩니다.
+
+    Examples:
+        >>> async with PollingScheduler(max_in_flight=100) as scheduler:
+        ...     future = scheduler.add(client, deadline=180.0)
+        ...     result = await future
+    """
+
+    def __init__(
+        self, strategy: Optional[PollingStrategy] = None, max_in_flight: int = 50,
+        max_polls_per_second: Optional[float] = None
+    ):
+        """
+        Args:
+            strategy: 인증 완료 여부 확인 간격 (기본값: PollingStrategy())
+            max_in_flight: 동시에 진행할 최대 확인 요청 수
+            max_polls_per_second: 초당 최대 확인 요청 수 (기본값: 제한 없음)
+        """
+
+        self._strategy = strategy or PollingStrategy()
+        self._max_in_flight = max_in_flight
+        self._dispatch_interval = 1 / max_polls_per_second if max_polls_per_second else 0.0
+
+        # (다음 확인 시각, 순번, 세션) 힙
+        self._heap: list[tuple[float, int, _PendingSession]] = []
+        self._sequence = itertools.count()
+        # 확인 요청 중인 작업 -> 세션 (close 시 해당 세션의 Future도 취소합니다.)
+        self._in_flight: dict[asyncio.Task, _PendingSession] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._runner: Optional[asyncio.Task] = None
+
+    @property
+    def pending(self) -> int:
+        """인증 완료를 기다리는 세션 수를 반환"""
+        return sum(1 for _, _, entry in self._heap if not entry.future.done()) + len(self._in_flight)
+
+    def add(self, session: "PASS_NICE", deadline: float = 180.0) -> "asyncio.Future[Result[VerificationData]]":
+        """인증 완료를 기다릴 세션을 등록합니다.
+
+        Args:
+            session: PASS 앱 인증 요청을 전송한 세션 객체
+            deadline: 최대 대기 시간 (초)
+
+        Returns:
+            asyncio.Future[Result[VerificationData]]: 인증 완료 또는 대기 시간 초과 시 결과가 전달되는 Future
+            (Future를 취소하면 해당 세션의 확인을 중단합니다.)
+
+        Raises:
+            SessionNotInitializedError: 세션이 올바르게 초기화되지 않은 경우 발생하는 예외입니다.
+        """
+
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[Result[VerificationData]]" = loop.create_future()
+
+        state_error = session._check_push_state()
+        if state_error is not None:
+            future.set_result(state_error)
+            return future
+
+        self._start(loop)
+
+        entry = _PendingSession(session, future, loop.time() + deadline)
+        self._schedule(entry, loop.time() + self._strategy.interval(0))
+
+        return future
+
+    async def close(self) -> None:
+        """스케줄러를 중단하고, 대기 중인 모든 세션의 Future를 취소합니다."""
+        # 완료된 작업은 _in_flight에서 제거되므로, 취소하기 전에 확인 중인 세션을 모아둡니다.
+        entries = [entry for _, _, entry in self._heap]
+        entries.extend(self._in_flight.values())
+
+        tasks = list(self._in_flight)
+        if self._runner is not None:
+            tasks.append(self._runner)
+
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        for entry in entries:
+            entry.future.cancel()
+
+        self._heap.clear()
+        self._in_flight.clear()
+        self._runner = None
+
+    def _start(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._runner is not None and not self._runner.done():
+            return
+
+        self._semaphore = asyncio.Semaphore(self._max_in_flight)
+        self._wakeup = asyncio.Event()
+        self._runner = loop.create_task(self._run())
+
+    def _schedule(self, entry: _PendingSession, poll_at: float) -> None:
+        heapq.heappush(self._heap, (poll_at, next(self._sequence), entry))
+
+        # 가장 이른 확인 시각이 바뀌었을 수 있으므로 대기 중인 작업을 깨웁니다.
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        assert self._semaphore is not None and self._wakeup is not None
+        loop = asyncio.get_running_loop()
+        next_dispatch_at = 0.0
+
+        while True:
+            self._wakeup.clear()
+
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+
+            poll_at, _, entry = self._heap[0]
+            delay = max(poll_at, next_dispatch_at) - loop.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+
+                except asyncio.TimeoutError:
+                    pass
+
+                continue
+
+            if entry.future.done():
+                heapq.heappop(self._heap)
+                continue
+
+            # 슬롯을 기다리는 동안에도 세션이 힙에 남아 있도록, 슬롯을 얻은 뒤에 꺼냅니다. (close 시 Future 취소 대상)
+            await self._semaphore.acquire()
+
+            # 기다리는 동안 더 이른 세션이 추가되었을 수 있으므로 가장 이른 세션을 꺼냅니다.
+            if not self._heap:
+                self._semaphore.release()
+                continue
+
+            _, _, entry = heapq.heappop(self._heap)
+            if entry.future.done():
+                self._semaphore.release()
+                continue
+
+            next_dispatch_at = loop.time() + self._dispatch_interval
+
+            task = loop.create_task(self._poll(entry))
+            self._in_flight[task] = entry
+            task.add_done_callback(self._discard_in_flight)
+
+    def _discard_in_flight(self, task: asyncio.Task) -> None:
+        self._in_flight.pop(task, None)
+
+    async def _poll(self, entry: _PendingSession) -> None:
+        assert self._semaphore is not None
+        loop = asyncio.get_running_loop()
+
+        try:
+            result = await entry.session.check_push_verification()
+
+        except NetworkError:
+            result = None
+
+        except Exception as e:
+            if not entry.future.done():
+                entry.future.set_exception(e)
+
+            return
+
+        finally:
+            self._semaphore.release()
+
+        if entry.future.done():
+            return
+
+        if result is not None and result.status:
+            entry.future.set_result(result)
+            return
+
+        now = loop.time()
+        if now >= entry.deadline_at:
+            entry.session._emit("expired", "본인인증 대기 시간이 초과되었습니다.")
+            entry.future.set_result(Result(False, "본인인증 대기 시간이 초과되었습니다."))
+            return
+
+        entry.attempt += 1
+        self._schedule(entry, min(now + self._strategy.interval(entry.attempt), entry.deadline_at))
+
+    # ----- context manager ----- #
+    async def __aenter__(self):
+        """async with 구문 지원"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """async with 구문 지원"""
+        await self.close()
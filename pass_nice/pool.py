@@ -0,0 +1,228 @@
+"""
+PASS-NICE 사전 초기화 세션 풀
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Literal, Optional
+
+import httpx
+
+from .PASS_NICE import PASS_NICE
+from .transport import create_shared_client
+
+# 통신사와 무관하게 사전 초기화(prepare_session)만 완료된 세션을 보관하는 키
+_PREPARED_KEY = ("", "")
+
+
+class SessionPool:
+    """
+    `init_session`까지 마친 PASS_NICE 세션을 (통신사, 인증 방식)별로 미리 준비해두는 풀입니다.
+
+    - 기능
+        - 세션을 꺼낼 때 미리 초기화된 세션을 O(1)로 반환합니다. (캡챠 요청부터 바로 진행할 수 있습니다.)
+        - 꺼내진 만큼 백그라운드에서 세션을 다시 채웁니다.
+        - NICE 세션이 만료되기 전에 TTL이 지난 세션을 제거합니다.
+        - 사전 초기화된 세션(`prepare_session`)을 통신사 구분 없이 보관하여, 모든 통신사가 하나의 풀을 공유할 수 있습니다.
+
+    - Notes
+        - 풀의 모든 세션은 하나의 공유 클라이언트(`create_shared_client()`)를 사용합니다.
+        - 풀에서 꺼낸 세션의 close()는 공유 클라이언트를 닫지 않으므로, 사용 후 호출하지 않아도 됩니다.
+
+    Examples:
+        >>> async with SessionPool(size=10) as pool:
+        ...     pool.warm("SK", "sms")
+        ...     client = await pool.acquire("SK", "sms")
+        ...     await client.retrieve_captcha()
+    """
+
+    def __init__(
+        self, size: int = 5, ttl: float = 180.0, refill_interval: float = 5.0,
+        client: Optional[httpx.AsyncClient] = None, checkplus_custom_url: Optional[str] = None,
+        prefetch_captcha: bool = False
+    ):
+        """
+        Args:
+            size: (통신사, 인증 방식)별로 유지할 세션 수
+            ttl: 세션을 보관할 최대 시간 (초, NICE 세션 만료 시간보다 짧게 지정해주세요.)
+            refill_interval: 만료 세션 제거 및 재충전 주기 (초)
+            client: 세션들이 공유할 HTTP 클라이언트 (기본값: 풀 내부에서 생성)
+            checkplus_custom_url: checkplus 데이터 요청 URL (기본값: 한국도로교통공사)
+            prefetch_captcha: True일 경우 세션을 준비할 때 캡챠 이미지까지 미리 받아둡니다. (sms, app_push 방식만 해당)
+        """
+
+        self._size = size
+        self._ttl = ttl
+        self._refill_interval = refill_interval
+        self._checkplus_custom_url = checkplus_custom_url
+        self._prefetch_captcha = prefetch_captcha
+
+        self._owns_client = client is None
+        self.client = client or create_shared_client()
+
+        # (통신사, 인증 방식) -> deque[(초기화 시작 시각, 세션)], 오래된 세션이 왼쪽에 위치합니다.
+        self._sessions: dict[tuple[str, str], deque[tuple[float, PASS_NICE]]] = {}
+        self._refill_tasks: dict[tuple[str, str], asyncio.Task] = {}
+        self._maintain_task: Optional[asyncio.Task] = None
+
+    def warm(
+        self, cell_corp: Literal["SK", "KT", "LG", "SM", "KM", "LM"],
+        auth_type: Literal["sms", "app_push", "app_qr"]
+    ) -> None:
+        """해당 (통신사, 인증 방식)의 세션을 백그라운드에서 미리 채우도록 등록합니다."""
+        key = (cell_corp, auth_type)
+        self._sessions.setdefault(key, deque())
+        self._schedule_refill(key)
+
+    def warm_prepared(self) -> None:
+        """통신사와 무관한 사전 초기화 세션을 백그라운드에서 미리 채우도록 등록합니다.
+
+        해당 (통신사, 인증 방식)으로 완전히 초기화된 세션이 없을 때, `acquire`는 사전 초기화된 세션의
+        통신사별 단계만 진행하여 반환합니다.
+        """
+        self._sessions.setdefault(_PREPARED_KEY, deque())
+        self._schedule_refill(_PREPARED_KEY)
+
+    async def acquire(
+        self, cell_corp: Literal["SK", "KT", "LG", "SM", "KM", "LM"],
+        auth_type: Literal["sms", "app_push", "app_qr"]
+    ) -> PASS_NICE:
+        """초기화된 세션을 하나 꺼내 반환합니다.
+
+        준비된 세션이 없다면 사전 초기화된 세션을 마저 초기화하거나, 즉시 새 세션을 초기화하여 반환합니다.
+        (`warm` 또는 `warm_prepared`로 등록된 세션만 백그라운드에서 다시 채워집니다.)
+
+        Args:
+            cell_corp: 인증 요청 대상자의 통신사 ('SK', 'KT', 'LG', 'SM', 'KM', 'LM')
+            auth_type: 인증 진행 방식 ('sms', 'app_push', 'app_qr')
+
+        Returns:
+            PASS_NICE: `init_session`이 완료된 세션 객체
+
+        Raises:
+            NetworkError: 세션을 마저 초기화하던 중 통신에 실패한 경우
+            ParseError: 세션을 마저 초기화하던 중 NICE 응답 파싱에 실패한 경우
+        """
+
+        key = (cell_corp, auth_type)
+        sessions = self._sessions.get(key)
+        if sessions is not None:
+            self._evict_expired(sessions)
+
+        prepared = self._sessions.get(_PREPARED_KEY)
+        if prepared is not None:
+            self._evict_expired(prepared)
+
+        if sessions:
+            _, session = sessions.popleft()
+            self._schedule_refill(key)
+
+        elif prepared:
+            _, session = prepared.popleft()
+            self._schedule_refill(_PREPARED_KEY)
+            await session.init_session(auth_type, self._checkplus_custom_url, cell_corp, self._prefetch_captcha)
+
+        else:
+            _, session = await self._create_session(key)
+
+        return session
+
+    def available(
+        self, cell_corp: Literal["SK", "KT", "LG", "SM", "KM", "LM"],
+        auth_type: Literal["sms", "app_push", "app_qr"]
+    ) -> int:
+        """해당 (통신사, 인증 방식)으로 바로 꺼낼 수 있는 세션 수를 반환합니다."""
+        sessions = self._sessions.get((cell_corp, auth_type))
+        if not sessions:
+            return 0
+
+        self._evict_expired(sessions)
+        return len(sessions)
+
+    # ----- 풀 관리 ----- #
+    def start(self) -> None:
+        """만료 세션 제거 및 재충전을 주기적으로 수행하는 백그라운드 작업을 시작합니다."""
+        if self._maintain_task is None or self._maintain_task.done():
+            self._maintain_task = asyncio.create_task(self._maintain())
+
+    async def close(self) -> None:
+        """백그라운드 작업을 중단하고 보관 중인 세션과 HTTP 클라이언트를 정리합니다."""
+        tasks = list(self._refill_tasks.values())
+        if self._maintain_task is not None:
+            tasks.append(self._maintain_task)
+
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        self._refill_tasks.clear()
+        self._maintain_task = None
+        self._sessions.clear()
+
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def _maintain(self) -> None:
+        while True:
+            for key, sessions in self._sessions.items():
+                self._evict_expired(sessions)
+                self._schedule_refill(key)
+
+            await asyncio.sleep(self._refill_interval)
+
+    def _evict_expired(self, sessions: deque[tuple[float, PASS_NICE]]) -> None:
+        # 풀의 세션은 공유 클라이언트를 사용하므로, 만료된 세션은 별도의 정리 없이 버립니다.
+        deadline = time.monotonic() - self._ttl
+        while sessions and sessions[0][0] <= deadline:
+            sessions.popleft()
+
+    def _schedule_refill(self, key: tuple[str, str]) -> None:
+        task = self._refill_tasks.get(key)
+        if task is not None and not task.done():
+            return
+
+        self._refill_tasks[key] = asyncio.create_task(self._refill(key))
+
+    async def _refill(self, key: tuple[str, str]) -> None:
+        sessions = self._sessions.setdefault(key, deque())
+        missing = self._size - len(sessions)
+        if missing <= 0:
+            return
+
+        results = await asyncio.gather(
+            *(self._create_session(key) for _ in range(missing)),
+            return_exceptions=True
+        )
+
+        # 초기화에 실패한 세션은 다음 재충전 주기에 다시 시도합니다.
+        for result in results:
+            if not isinstance(result, BaseException):
+                sessions.append(result)
+
+    async def _create_session(self, key: tuple[str, str]) -> tuple[float, PASS_NICE]:
+        cell_corp, auth_type = key
+        created_at = time.monotonic()
+
+        if key == _PREPARED_KEY:
+            session = PASS_NICE(client=self.client)
+            await session.prepare_session(self._checkplus_custom_url)
+
+        else:
+            session = PASS_NICE(cell_corp, client=self.client)  # type: ignore
+            await session.init_session(
+                auth_type, self._checkplus_custom_url, prefetch_captcha=self._prefetch_captcha  # type: ignore
+            )
+
+        return (created_at, session)
+
+    # ----- context manager ----- #
+    async def __aenter__(self):
+        """async with 구문 지원"""
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """async with 구문 지원"""
+        await self.close()
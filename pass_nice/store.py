@@ -0,0 +1,279 @@
+"""
+PASS-NICE 세션 저장소
+"""
+
+import asyncio
+import heapq
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional
+
+import httpx
+
+from .PASS_NICE import PASS_NICE
+from .transport import create_shared_client
+
+
+class SessionStore(ABC):
+    """
+    `PASS_NICE.export_state()`로 직렬화된 세션 상태를 ID별로 보관하는 저장소의 기본 클래스입니다.
+
+    - Notes
+        - 모든 세션은 TTL을 가지며, 만료된 세션은 `get`에서 반환되지 않습니다.
+        - 직접 구현하시려면 `put`, `get`, `expire`, `evict_expired`를 구현해주세요.
+    """
+
+    @abstractmethod
+    async def put(self, session_id: str, state: bytes, ttl: Optional[float] = None) -> None:
+        """세션 상태를 저장합니다. (이미 있는 ID라면 덮어씁니다.)"""
+
+    @abstractmethod
+    async def get(self, session_id: str) -> Optional[bytes]:
+        """세션 상태를 반환합니다. (없거나 만료된 경우 None)"""
+
+    @abstractmethod
+    async def expire(self, session_id: str) -> None:
+        """세션 상태를 즉시 삭제합니다."""
+
+    @abstractmethod
+    async def evict_expired(self) -> int:
+        """만료된 세션 상태를 삭제하고, 삭제된 개수를 반환합니다."""
+
+    async def close(self) -> None:
+        """저장소를 종료합니다."""
+
+
+class MemorySessionStore(SessionStore):
+    """
+    프로세스 메모리에 세션 상태를 보관하는 LRU + TTL 저장소입니다.
+
+    - Notes
+        - 최대 개수를 넘으면 가장 오래 사용되지 않은 세션부터 삭제합니다.
+        - 만료 시각을 힙으로 관리하여, 만료 세션 삭제가 세션당 O(log n)으로 동작합니다.
+    """
+
+    def __init__(self, max_size: int = 100_000, default_ttl: float = 600.0):
+        """
+        Args:
+            max_size: 보관할 최대 세션 수
+            default_ttl: 기본 세션 보관 시간 (초)
+        """
+
+        self._max_size = max_size
+        self._default_ttl = default_ttl
+
+        # 세션 ID -> (만료 시각, 세션 상태), 최근에 사용된 세션이 뒤쪽에 위치합니다.
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._expiry_heap: list[tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def put(self, session_id: str, state: bytes, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + (self._default_ttl if ttl is None else ttl)
+
+        self._entries[session_id] = (expires_at, state)
+        self._entries.move_to_end(session_id)
+        heapq.heappush(self._expiry_heap, (expires_at, session_id))
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+        self._evict_expired()
+
+    async def get(self, session_id: str) -> Optional[bytes]:
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return None
+
+        expires_at, state = entry
+        if expires_at <= time.monotonic():
+            del self._entries[session_id]
+            return None
+
+        self._entries.move_to_end(session_id)
+        return state
+
+    async def expire(self, session_id: str) -> None:
+        self._entries.pop(session_id, None)
+
+    async def evict_expired(self) -> int:
+        return self._evict_expired()
+
+    def _evict_expired(self) -> int:
+        now, evicted = time.monotonic(), 0
+
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expires_at, session_id = heapq.heappop(self._expiry_heap)
+
+            # 덮어쓰기/삭제로 이미 무효화된 힙 항목은 건너뜁니다.
+            entry = self._entries.get(session_id)
+            if entry is not None and entry[0] == expires_at:
+                del self._entries[session_id]
+                evicted += 1
+
+        # 무효화된 힙 항목이 쌓이면 남은 세션 기준으로 힙을 다시 만듭니다.
+        if len(self._expiry_heap) > 2 * len(self._entries) + 1024:
+            self._expiry_heap = [(expires_at, session_id) for session_id, (expires_at, _) in self._entries.items()]
+            heapq.heapify(self._expiry_heap)
+
+        return evicted
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    로컬 SQLite 파일에 세션 상태를 보관하는 저장소입니다.
+    같은 서버의 여러 워커(프로세스)가 하나의 파일을 공유할 수 있습니다.
+
+    - Notes
+        - 만료 시각 인덱스를 사용하여 만료 세션 삭제가 O(log n)으로 동작합니다.
+        - 만료 세션은 `evict_expired()` 호출 시 삭제됩니다. (`SessionManager`가 주기적으로 호출합니다.)
+    """
+
+    def __init__(self, path: str = "pass_nice_sessions.db", default_ttl: float = 600.0):
+        """
+        Args:
+            path: SQLite 데이터베이스 파일 경로 (":memory:" 사용 시 프로세스 메모리에 보관)
+            default_ttl: 기본 세션 보관 시간 (초)
+        """
+
+        self._default_ttl = default_ttl
+        self._lock = threading.Lock()
+
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS pass_nice_sessions ("
+            "session_id TEXT PRIMARY KEY, state BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS pass_nice_sessions_expires_at ON pass_nice_sessions (expires_at)"
+        )
+
+    async def put(self, session_id: str, state: bytes, ttl: Optional[float] = None) -> None:
+        # 여러 프로세스가 공유하므로 만료 시각은 monotonic이 아닌 wall-clock 기준으로 저장합니다.
+        expires_at = time.time() + (self._default_ttl if ttl is None else ttl)
+        await self._execute(
+            "INSERT OR REPLACE INTO pass_nice_sessions (session_id, state, expires_at) VALUES (?, ?, ?)",
+            (session_id, state, expires_at)
+        )
+
+    async def get(self, session_id: str) -> Optional[bytes]:
+        rows, _ = await self._execute(
+            "SELECT state FROM pass_nice_sessions WHERE session_id = ? AND expires_at > ?",
+            (session_id, time.time())
+        )
+
+        return bytes(rows[0][0]) if rows else None
+
+    async def expire(self, session_id: str) -> None:
+        await self._execute("DELETE FROM pass_nice_sessions WHERE session_id = ?", (session_id,))
+
+    async def evict_expired(self) -> int:
+        _, rowcount = await self._execute("DELETE FROM pass_nice_sessions WHERE expires_at <= ?", (time.time(),))
+        return rowcount
+
+    async def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    async def _execute(self, sql: str, parameters: tuple) -> tuple[list, int]:
+        # 디스크 I/O가 이벤트 루프를 막지 않도록 별도 스레드에서 실행합니다.
+        return await asyncio.to_thread(self._execute_sync, sql, parameters)
+
+    def _execute_sync(self, sql: str, parameters: tuple) -> tuple[list, int]:
+        with self._lock:
+            cursor = self._connection.execute(sql, parameters)
+            return cursor.fetchall(), cursor.rowcount
+
+
+class SessionManager:
+    """
+    진행 중인 본인인증 세션을 ID 기준으로 저장소에 보관하고 복원하는 관리자입니다.
+    세션 상태가 워커 메모리 밖(저장소)에 있으므로, 어떤 워커에서든 인증을 이어서 진행할 수 있습니다.
+
+    Examples:
+        >>> manager = SessionManager(SQLiteSessionStore("sessions.db"))
+        >>> session_id = await manager.put(client)
+        >>> client = await manager.get(session_id)
+    """
+
+    def __init__(
+        self, store: Optional[SessionStore] = None, client: Optional[httpx.AsyncClient] = None,
+        evict_interval: float = 60.0
+    ):
+        """
+        Args:
+            store: 세션 상태를 보관할 저장소 (기본값: MemorySessionStore)
+            client: 복원된 세션들이 공유할 HTTP 클라이언트 (기본값: 내부에서 생성)
+            evict_interval: 만료 세션 삭제 주기 (초, put 호출 시 주기가 지났다면 삭제합니다.)
+        """
+
+        self.store = store if store is not None else MemorySessionStore()
+        self._evict_interval = evict_interval
+        self._last_evicted_at = time.monotonic()
+
+        self._owns_client = client is None
+        self.client = client or create_shared_client()
+
+    async def put(self, session: PASS_NICE, session_id: Optional[str] = None, ttl: Optional[float] = None) -> str:
+        """세션 상태를 저장소에 저장하고 세션 ID를 반환합니다.
+
+        Args:
+            session: 저장할 세션 객체
+            session_id: 세션 ID (기본값: 새 ID 생성)
+            ttl: 세션 보관 시간 (초, 기본값: 저장소 기본값)
+
+        Returns:
+            str: 세션 ID (외부에 노출되어도 세션 정보를 유추할 수 없는 임의의 값)
+        """
+
+        if session_id is None:
+            session_id = uuid.uuid4().hex
+
+        await self.store.put(session_id, session.export_state(), ttl)
+
+        if time.monotonic() - self._last_evicted_at >= self._evict_interval:
+            self._last_evicted_at = time.monotonic()
+            await self.store.evict_expired()
+
+        return session_id
+
+    async def get(self, session_id: str) -> Optional[PASS_NICE]:
+        """세션 ID로 세션 객체를 복원합니다. (없거나 만료된 경우 None)
+
+        Raises:
+            ParseError: 저장된 세션 상태 형식이 올바르지 않은 경우
+        """
+
+        state = await self.store.get(session_id)
+        if state is None:
+            return None
+
+        return PASS_NICE.from_state(state, client=self.client)
+
+    async def expire(self, session_id: str) -> None:
+        """세션을 저장소에서 삭제합니다. (인증 완료/포기 시 호출해주세요.)"""
+        await self.store.expire(session_id)
+
+    async def close(self) -> None:
+        """저장소와 HTTP 클라이언트를 종료합니다."""
+        await self.store.close()
+
+        if self._owns_client:
+            await self.client.aclose()
+
+    # ----- context manager ----- #
+    async def __aenter__(self):
+        """async with 구문 지원"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """async with 구문 지원"""
+        await self.close()
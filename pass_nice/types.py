@@ -2,12 +2,79 @@
 PASS-NICE 타입 정의
 """
 
+from calendar import isleap
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Generic, Literal, Optional, TypeVar
+from typing import Any, Generic, Literal, Optional, TypeVar, Union
+
+from .exceptions import ParseError
 
 T = TypeVar("T")
 
+
+# 월별 최대 일수 (2월 29일은 윤년인지 따로 확인합니다.)
+_DAYS_IN_MONTH = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _check_birthdate(value: str) -> str:
+    """YYYYMMDD 형식이며 실제 존재하는 생년월일인지 확인합니다. (datetime으로 변환하지 않고 그대로 반환합니다.)
+
+    Raises:
+        ParseError: 형식이 올바르지 않거나 존재하지 않는 날짜인 경우
+    """
+    if not (isinstance(value, str) and value.isascii() and value.isdigit() and len(value) == 8):
+        raise ParseError("올바르지 않은 생년월일 형식입니다.")
+
+    year, month, day = int(value[0:4]), int(value[4:6]), int(value[6:8])
+    if not (1 <= year and 1 <= month <= 12 and 1 <= day <= _DAYS_IN_MONTH[month]) \
+            or (month == 2 and day == 29 and not isleap(year)):
+        raise ParseError("존재하지 않는 생년월일입니다.")
+
+    return value
+
+
+def _parse_birthdate(value: str) -> datetime:
+    """(_check_birthdate로 확인한) YYYYMMDD 형식의 생년월일을 datetime으로 변환합니다.
+
+    `datetime.strptime`과 동일한 결과를 반환하지만, 고정 형식이므로 자릿수로 잘라서 변환합니다.
+    """
+    # 문자열을 한 번만 정수로 변환한 뒤 자릿수로 나눕니다.
+    year, month_day = divmod(int(value), 10000)
+    month, day = divmod(month_day, 100)
+
+    return datetime(year, month, day)
+
+
+def _format_birthdate(value: Union[datetime, str]) -> str:
+    """생년월일을 YYYYMMDD 형식 문자열로 변환합니다. (아직 변환되지 않은 문자열은 그대로 반환합니다.)"""
+    if isinstance(value, str):
+        return value
+
+    return f"{value.year:04d}{value.month:02d}{value.day:02d}"
+
+
+class _LazyBirthdate:
+    """
+    생년월일 문자열(YYYYMMDD)을 보관해두었다가, 처음 접근할 때 datetime으로 변환하는 디스크립터입니다.
+    (datetime을 넘긴 경우 그대로 보관합니다. 문자열은 _check_birthdate로 확인한 값이어야 합니다.)
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._attr_name = f"_{name}"
+
+    def __get__(self, instance: Any, owner: type) -> datetime:
+        if instance is None: # 클래스 속성 접근 시 (dataclass 기본값 없음)
+            raise AttributeError(self._attr_name)
+
+        value = instance.__dict__[self._attr_name]
+        if isinstance(value, str):
+            value = instance.__dict__[self._attr_name] = _parse_birthdate(value)
+
+        return value
+
+    def __set__(self, instance: Any, value: Union[datetime, str]) -> None:
+        instance.__dict__[self._attr_name] = value
+
 @dataclass(frozen=True)
 class Result(Generic[T]):
     """API 호출 결과를 나타내는 제네릭 데이터 클래스"""
@@ -37,9 +104,53 @@ class Result(Generic[T]):
 
 @dataclass(frozen=True)
 class VerificationData():
-    """본인인증 데이터를 나타내는 데이터 클래스"""
+    """
+    본인인증 데이터를 나타내는 데이터 클래스
+
+    - Notes
+        - birthdate에 YYYYMMDD 형식 문자열을 넘기면, 처음 접근할 때 datetime으로 변환합니다.
+          (형식은 생성 전에 확인하며, 변환만 처음 접근할 때로 미룹니다.)
+    """
     name: str
-    birthdate: datetime
+    birthdate: datetime = _LazyBirthdate()  # type: ignore
     gender: Literal["1", "2"] # 남자, 여자
     phone_number: str
-    mobile_carrier: Literal["SK", "KT", "LG", "SM", "KM", "LM"]
\ No newline at end of file
+    mobile_carrier: Literal["SK", "KT", "LG", "SM", "KM", "LM"]
+
+@dataclass(frozen=True)
+class VerificationEvent():
+    """본인인증 진행 상황을 나타내는 이벤트 데이터 클래스"""
+    type: Literal[
+        "initialized",    # 세션 초기화 완료
+        "captcha_ready",  # 캡챠 이미지 확인 완료
+        "sent",           # 인증 요청 전송 (QR 생성) 완료
+        "polling",        # PASS 앱 인증 완료 여부 확인 중
+        "completed",      # 본인인증 완료 (data: VerificationData)
+        "failed",         # 인증 전송/확인 실패 (message: 실패 사유)
+        "expired",        # 대기 시간 초과
+    ]
+    message: str
+    data: Optional[Any] = None
+
+@dataclass(frozen=True)
+class BulkValidationResult():
+    """여러 입력값의 일괄 검증 결과를 나타내는 데이터 클래스"""
+    values: dict[str, list[Optional[str]]]  # 필드명 -> NICE 형식으로 변환된 값 목록 (올바르지 않은 값은 None)
+    errors: list[tuple[tuple[str, str], ...]]  # 레코드별 (필드명, 오류 메시지) 목록 (올바른 레코드는 빈 튜플)
+
+    def __len__(self) -> int:
+        return len(self.errors)
+
+    @property
+    def valid(self) -> list[bool]:
+        """레코드별 검증 통과 여부를 반환"""
+        return [not error for error in self.errors]
+
+    @property
+    def invalid_count(self) -> int:
+        """검증에 실패한 레코드 수를 반환"""
+        return sum(1 for error in self.errors if error)
+
+    def invalid_indices(self) -> list[int]:
+        """검증에 실패한 레코드의 인덱스 목록을 반환"""
+        return [index for index, error in enumerate(self.errors) if error]
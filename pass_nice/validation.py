@@ -0,0 +1,222 @@
+"""
+PASS-NICE 입력값 검증
+"""
+
+import re
+from datetime import datetime
+from typing import Any, Callable, Iterable, Mapping, Optional, Sequence, Union
+
+from .exceptions import ValidationError
+from .types import BulkValidationResult
+
+# ----- 필드별 형식 (한 번만 컴파일하여 재사용합니다.) ----- #
+# 내국인: 한글 2~20자, 외국인: 영문 이름 (공백, 마침표, 하이픈 허용)
+_NAME_PATTERN = re.compile(r"[가-힣]{2,20}|[A-Za-z][A-Za-z .\-]{1,59}")
+
+# 휴대전화번호: 01X 식별번호 + 8자리 (하이픈은 정해진 위치에만 허용)
+_PHONE_NUMBER_PATTERN = re.compile(r"(01[016789])-?([0-9]{4})-?([0-9]{4})")
+
+# 생년월일: YYMMDD 또는 YYYYMMDD
+_BIRTHDATE_PATTERN = re.compile(r"(19|20)?([0-9]{2})(0[1-9]|1[0-2])(0[1-9]|[12][0-9]|3[01])")
+
+_DIGITS6_PATTERN = re.compile(r"[0-9]{6}")
+
+# 성별코드(주민등록번호 7번째 자리) -> 출생 세기 (1, 2, 5, 6: 1900년대 / 3, 4, 7, 8: 2000년대)
+_GENDER_CENTURIES = {"1": 1900, "2": 1900, "5": 1900, "6": 1900, "3": 2000, "4": 2000, "7": 2000, "8": 2000}
+
+
+# ----- 필드별 검증 (올바른 경우 NICE 형식으로 변환된 값, 올바르지 않은 경우 None 반환) ----- #
+def _normalize_name(name: Any) -> Optional[str]:
+    if not isinstance(name, str):
+        return None
+
+    name = name.strip()
+    return name if _NAME_PATTERN.fullmatch(name) else None
+
+
+def _normalize_birthdate(birthdate: Any) -> Optional[str]:
+    if not isinstance(birthdate, str):
+        return None
+
+    match = _BIRTHDATE_PATTERN.fullmatch(birthdate)
+    if match is None:
+        return None
+
+    # YYMMDD의 세기는 성별코드로 정해지므로, 2000년대 기준으로 실제 존재하는 날짜인지 확인합니다.
+    # (2000년은 윤년이므로 1900년대에만 존재하는 날짜는 없습니다.)
+    century, year, month, day = match.groups()
+    if int(day) > 28 and not _is_real_date(int(century or "20") * 100 + int(year), int(month), int(day)):
+        return None
+
+    return birthdate[-6:] # NICE 형식(YYMMDD)으로 변환
+
+
+def _normalize_gender(gender: Any) -> Optional[str]:
+    return gender if isinstance(gender, str) and gender in _GENDER_CENTURIES else None
+
+
+def _normalize_phone_number(phone_number: Any) -> Optional[str]:
+    if not isinstance(phone_number, str):
+        return None
+
+    match = _PHONE_NUMBER_PATTERN.fullmatch(phone_number)
+    return "".join(match.groups()) if match else None # 하이픈 삭제
+
+
+def _normalize_digits6(value: Any) -> Optional[str]:
+    return value if isinstance(value, str) and _DIGITS6_PATTERN.fullmatch(value) else None
+
+
+def _is_real_date(year: int, month: int, day: int) -> bool:
+    try:
+        datetime(year, month, day)
+        return True
+
+    except ValueError:
+        return False
+
+
+def _expand_birthdate(birthdate: str, gender: str) -> str:
+    """(형식 검증을 통과한) 생년월일을 성별코드의 출생 세기를 반영하여 YYYYMMDD 형식으로 변환합니다."""
+    if len(birthdate) == 8:
+        return birthdate
+
+    return f"{_GENDER_CENTURIES[gender] // 100}{birthdate}"
+
+
+def _matches_gender_century(birthdate: str, gender: str) -> bool:
+    """생년월일이 성별코드의 출생 세기에 실제로 존재하는 날짜인지 확인합니다. (두 값 모두 형식 검증을 통과한 경우)"""
+    expanded = _expand_birthdate(birthdate, gender)
+    if int(expanded[0:2]) * 100 != _GENDER_CENTURIES[gender]:
+        return False
+
+    # 이미 날짜를 확인했으므로, 세기에 따라 달라지는 2월 29일만 다시 확인합니다.
+    return expanded[4:8] != "0229" or _is_real_date(int(expanded[0:4]), 2, 29)
+
+
+# 필드명 -> (검증 함수, 오류 메시지)
+_FIELD_VALIDATORS: dict[str, tuple[Callable[[Any], Optional[str]], str]] = {
+    "name": (_normalize_name, "올바르지 않은 이름을 입력하셨습니다."),
+    "birthdate": (_normalize_birthdate, "올바르지 않은 생년월일을 입력하셨습니다."),
+    "gender": (_normalize_gender, "올바르지 않은 성별코드를 입력하셨습니다."),
+    "phone_number": (_normalize_phone_number, "올바르지 않은 휴대전화번호를 입력하셨습니다."),
+    "captcha_answer": (_normalize_digits6, "올바르지 않은 캡챠 코드를 입력하셨습니다."),
+    "sms_code": (_normalize_digits6, "SMS 코드는 6자리 숫자여야 합니다."),
+}
+
+_GENDER_CENTURY_ERROR = ("birthdate", "생년월일이 성별코드와 일치하지 않습니다.")
+
+
+def _validate_field(field: str, value: Any) -> str:
+    """필드 하나를 검증하고 NICE 형식으로 변환된 값을 반환합니다.
+
+    Raises:
+        ValidationError: 값이 올바르지 않은 경우 (field 속성에 필드명이 포함됩니다.)
+    """
+    normalize, message = _FIELD_VALIDATORS[field]
+
+    normalized = normalize(value)
+    if normalized is None:
+        raise ValidationError(message, field=field)
+
+    return normalized
+
+
+def _validate_birthdate_gender(birthdate: str, gender: str) -> None:
+    """(형식 검증을 통과한) 생년월일과 성별코드의 출생 세기가 일치하는지 확인합니다.
+
+    Raises:
+        ValidationError: 일치하지 않는 경우
+    """
+    if not _matches_gender_century(birthdate, gender):
+        field, message = _GENDER_CENTURY_ERROR
+        raise ValidationError(message, field=field)
+
+
+def validate_many(
+    records: Union[Mapping[str, Sequence[Any]], Iterable[Mapping[str, Any]]],
+    fields: Optional[Iterable[str]] = None
+) -> BulkValidationResult:
+    """여러 인증 요청 대상자의 입력값을 한 번에 검증합니다. (NICE 세션을 열기 전 사전 검증용)
+
+    `send_sms_verification`, `send_push_verification`, `check_sms_verification`과 동일한 기준으로 검증하며,
+    예외를 발생시키지 않고 레코드별 오류 목록을 반환합니다.
+
+    Args:
+        records: 검증할 입력값
+            - 열(column) 형식: {"birthdate": [...], "phone_number": [...]}
+            - 레코드 형식: [{"birthdate": ..., "phone_number": ...}, ...] (Ex: csv.DictReader)
+            (검증 필드: name, birthdate, gender, phone_number, captcha_answer, sms_code 중 포함된 필드만 검증합니다.)
+        fields: 검증할 필드 목록 (기본값: 입력값에 포함된 필드, 레코드 형식은 모든 레코드의 필드를 합친 목록)
+            - 레코드에 해당 필드가 없는 경우 올바르지 않은 값으로 처리합니다.
+
+    Returns:
+        BulkValidationResult: 필드별 변환된 값 목록과 레코드별 오류 목록
+
+    Raises:
+        ValueError: 열 형식의 필드별 길이가 서로 다르거나, fields에 검증할 수 없는 필드가 포함된 경우
+
+    Examples:
+        >>> result = validate_many(csv.DictReader(file))
+        >>> for index in result.invalid_indices():
+        ...     print(index, result.errors[index])
+    """
+
+    if fields is not None:
+        fields = set(fields)
+        unknown = fields.difference(_FIELD_VALIDATORS)
+        if unknown:
+            raise ValueError(f"검증할 수 없는 필드입니다: {', '.join(sorted(unknown))}")
+
+    if isinstance(records, Mapping):
+        if fields is None:
+            fields = records.keys()
+
+        # 레코드 수는 검증하지 않는 열을 포함한 모든 열로 정합니다. (지정한 필드의 열이 없는 경우에도 레코드별 오류로 처리)
+        lengths = {len(column) for column in records.values()}
+        if len(lengths) > 1:
+            raise ValueError("필드별 입력값 개수가 서로 다릅니다.")
+
+        size = lengths.pop() if lengths else 0
+
+        # 지정한 필드의 열이 없는 경우 모든 레코드에 해당 필드가 없는 것으로 처리합니다.
+        columns = {
+            field: records[field] if field in records else [None] * size
+            for field in _FIELD_VALIDATORS if field in fields
+        }
+
+    else:
+        rows = records if isinstance(records, list) else list(records)
+        size = len(rows)
+
+        if fields is None:
+            fields = set().union(*rows)
+
+        columns = {field: [row.get(field) for row in rows] for field in _FIELD_VALIDATORS if field in fields}
+
+    # 올바른 레코드는 빈 튜플을 공유하고, 오류가 있는 레코드만 오류 목록을 만듭니다.
+    values: dict[str, list[Optional[str]]] = {}
+    errors: list[tuple[tuple[str, str], ...]] = [()] * size
+
+    for field, column in columns.items():
+        normalize, message = _FIELD_VALIDATORS[field]
+        normalized = values[field] = [normalize(value) for value in column]
+
+        error = ((field, message),)
+        for index in [index for index, value in enumerate(normalized) if value is None]:
+            errors[index] += error
+
+    # 생년월일과 성별코드가 모두 올바른 레코드만 출생 세기를 확인합니다.
+    if "birthdate" in values and "gender" in values:
+        error = (_GENDER_CENTURY_ERROR,)
+        birthdates, genders = columns["birthdate"], values["gender"]
+
+        for index in [
+            index for index, (birthdate, gender) in enumerate(zip(values["birthdate"], genders))
+            if birthdate is not None and gender is not None
+            and not _matches_gender_century(birthdates[index], gender)
+        ]:
+            errors[index] += error
+            values["birthdate"][index] = None
+
+    return BulkValidationResult(values, errors)
@@ -0,0 +1,121 @@
+"""
+테스트용 NICE 서버 (httpx.MockTransport)
+"""
+
+import asyncio
+import itertools
+from collections import Counter
+from typing import Optional
+
+import httpx
+import pytest
+
+from pass_nice import PASS_NICE
+
+REQUESTER_PAGE = """<html><form>
+<input type="hidden" name="m" value="checkplusService">
+<input type="hidden" name="EncodeData" value="ENCDATA">
+</form></html>"""
+
+DECRYPT_PAGE = """<script>
+form1.NICE_NAME.value = '홍길동';
+form1.NICE_GENDER.value = '1';
+form1.NICE_BIRTHEDATE.value = '20000101';
+form1.NICE_MOBILENO.value = '01012345678';
+</script>"""
+
+
+class FakeNice:
+    """
+    NICE 본인인증 흐름을 흉내 내는 테스트 서버입니다.
+
+    - confirm_after: PASS 앱 인증 확인 요청이 몇 번째부터 완료(0000)를 반환할지 (None: 완료하지 않음)
+    - check_delay: PASS 앱 인증 확인 요청의 응답 지연 시간 (초)
+    - fail_paths: httpx.ConnectError를 발생시킬 URL 경로 집합
+    - fail_times: fail_paths 요청을 실패시킬 횟수 (None: 항상 실패)
+    """
+
+    def __init__(self):
+        self.calls: Counter = Counter()
+        self.confirm_after: Optional[int] = 1
+        self.check_delay = 0.0
+        self.fail_paths: set[str] = set()
+        self.fail_times: Optional[int] = None
+        self.decrypt_page = DECRYPT_PAGE
+        self._counter = itertools.count()
+
+    @property
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handler)
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        response = await self.respond(request)
+
+        # 실제 전송 계층처럼 본문을 아직 읽지 않은 스트림으로 반환합니다.
+        return httpx.Response(response.status_code, headers=response.headers, stream=httpx.ByteStream(response.content))
+
+    async def respond(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.calls[path] += 1
+
+        if path in self.fail_paths and (self.fail_times is None or self.calls[path] <= self.fail_times):
+            raise httpx.ConnectError("connection failed", request=request)
+
+        if request.url.host == "www.ex.co.kr":
+            return httpx.Response(200, text=self.decrypt_page if request.url.query else REQUESTER_PAGE)
+
+        if path == "/CheckPlusSafeModel/checkplus.cb":
+            return httpx.Response(
+                200, text=f'const SERVICE_INFO = "SVC{next(self._counter)}";',
+                headers={"set-cookie": "JSESSIONID=SESSION; Path=/"}
+            )
+
+        if path == "/cert/main/menu":
+            return httpx.Response(200, text="menu")
+
+        if path == "/cert/mobileCert/method":
+            return httpx.Response(200, text='<input type="hidden" name="certInfoHash" value="HASH">')
+
+        if path == "/cert/mobileCert/qr/certification":
+            return httpx.Response(200, text='<div class="qr_num">123456</div>')
+
+        if path.endswith("/certification"):
+            return httpx.Response(200, text=f'const captchaVersion = "CAP{next(self._counter)}";')
+
+        if path.startswith("/cert/captcha/image/") or path.startswith("/cert/qr/image/"):
+            return httpx.Response(200, content=b"\x89PNG")
+
+        if path.endswith("/certification/proc") or path == "/cert/mobileCert/sms/confirm/proc":
+            return httpx.Response(200, json={"code": "SUCCESS"})
+
+        if path == "/cert/polling/confirm/check/proc":
+            if self.check_delay:
+                await asyncio.sleep(self.check_delay)
+
+            confirmed = self.confirm_after is not None and self.calls[path] >= self.confirm_after
+            return httpx.Response(200, json={"code": "0000" if confirmed else "0001"})
+
+        if path.endswith("/confirm/proc"):
+            return httpx.Response(200, text="ok")
+
+        if path == "/cert/result/send":
+            return httpx.Response(200, text='const queryString = "EncodeData=RESULT";')
+
+        return httpx.Response(404)
+
+
+@pytest.fixture
+def nice() -> FakeNice:
+    return FakeNice()
+
+
+@pytest.fixture
+def push_session(nice: FakeNice):
+    """PASS 앱 인증 요청까지 전송된 세션을 만드는 코루틴 함수"""
+    async def create() -> PASS_NICE:
+        session = PASS_NICE("SK", transport=nice.transport)
+        await session.init_session("app_push")
+        await session.send_push_verification("홍길동", "01012345678", "123456")
+        return session
+
+    return create
@@ -0,0 +1,32 @@
+import asyncio
+
+import pytest
+
+from pass_nice import PASS_NICE
+from pass_nice.exceptions import NetworkError
+
+
+def test_failed_refresh_does_not_keep_previous_image(nice):
+    async def run():
+        session = PASS_NICE("SK", transport=nice.transport)
+        try:
+            await session.init_session("sms")
+            await session.retrieve_captcha()
+            version = int(session._CAPTCHA_VERSION[len("CAP"):])
+
+            # 새로 발급될 버전의 이미지 요청을 한 번 실패시킵니다.
+            new_image_path = f"/cert/captcha/image/CAP{version + 1}"
+            nice.fail_paths = {new_image_path}
+            nice.fail_times = 1
+
+            with pytest.raises(NetworkError):
+                await session.refresh_captcha()
+
+            assert session._CAPTCHA_VERSION == f"CAP{version + 1}"
+            assert (await session.retrieve_captcha()).status
+            return nice.calls[new_image_path]
+
+        finally:
+            await session.close()
+
+    assert asyncio.run(run()) == 2
@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from pass_nice import PASS_NICE
+from pass_nice.exceptions import NetworkError, ValidationError
+
+
+def test_network_error_publishes_failed_event(nice):
+    nice.fail_paths = {"/cert/mobileCert/method"}
+
+    async def run():
+        session = PASS_NICE("SK", transport=nice.transport)
+        stream = session.events()
+        subscriber = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0)
+
+        with pytest.raises(NetworkError):
+            await session.init_session("app_push")
+
+        event = await asyncio.wait_for(subscriber, 1.0)
+        await session.close()
+        return event
+
+    event = asyncio.run(run())
+
+    assert event.type == "failed"
+    assert isinstance(event.data, NetworkError)
+
+
+def test_failed_event_does_not_end_stream(nice):
+    async def run():
+        session = PASS_NICE("SK", transport=nice.transport)
+        await session.init_session("app_push")
+
+        stream = session.events()
+        subscriber = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0)
+
+        with pytest.raises(ValidationError):
+            await session.send_push_verification("홍길동", "0101234", "123456")
+
+        failed = await asyncio.wait_for(subscriber, 1.0)
+
+        await session.send_push_verification("홍길동", "01012345678", "123456")
+        sent = await asyncio.wait_for(stream.__anext__(), 1.0)
+
+        await session.close()
+        return failed, sent
+
+    failed, sent = asyncio.run(run())
+
+    assert failed.type == "failed"
+    assert sent.type == "sent"
+
+
+def test_nested_call_publishes_single_failed_event(nice):
+    nice.fail_paths = {"/cert/mobileCert/method"}
+
+    async def run():
+        session = PASS_NICE("SK", transport=nice.transport)
+        queue = asyncio.Queue()
+        session._event_queues.append(queue)
+
+        with pytest.raises(NetworkError):
+            await session.init_qr_session()
+
+        events = []
+        while not queue.empty():
+            events.append(queue.get_nowait())
+
+        await session.close()
+        return events
+
+    events = asyncio.run(run())
+
+    assert [event.type for event in events if event.type == "failed"] == ["failed"]
+
+
+def test_concurrent_call_failure_publishes_failed_event(nice, push_session):
+    nice.confirm_after = None
+    nice.check_delay = 10.0
+
+    async def run():
+        session = await push_session()
+        queue = asyncio.Queue()
+        session._event_queues.append(queue)
+
+        # 다른 작업에서 같은 세션의 확인 요청이 진행 중인 동안 호출한 메서드가 실패하는 경우
+        polling = asyncio.ensure_future(session.check_push_verification())
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(ValidationError):
+            await session.send_push_verification("홍길동", "0101234", "123456")
+
+        event = await asyncio.wait_for(queue.get(), 1.0)
+
+        polling.cancel()
+        await asyncio.gather(polling, return_exceptions=True)
+        await session.close()
+        return event
+
+    event = asyncio.run(run())
+
+    assert event.type == "failed"
+    assert isinstance(event.data, ValidationError)
@@ -0,0 +1,126 @@
+import asyncio
+
+from pass_nice.limits import _NO_SLOT, _HostLimiter
+
+HOST = "nice.checkplus.co.kr"
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_unlimited_host_uses_no_slot():
+    limiter = _HostLimiter({HOST: 1})
+
+    assert limiter.slot("www.ex.co.kr") is _NO_SLOT
+
+
+def test_waiters_acquire_in_fifo_order():
+    limiter = _HostLimiter({HOST: 1})
+    order = []
+
+    async def request(index):
+        async with limiter.slot(HOST):
+            order.append(index)
+            await asyncio.sleep(0)
+
+    async def run():
+        await asyncio.gather(*(request(index) for index in range(5)))
+
+    asyncio.run(run())
+
+    assert order == [0, 1, 2, 3, 4]
+    assert limiter.in_flight() == 0 and limiter.queue_depth() == 0
+
+
+def test_cancelled_waiter_leaves_queue():
+    limiter = _HostLimiter({HOST: 1})
+
+    async def run():
+        await limiter.acquire(HOST)
+        waiter = asyncio.ensure_future(limiter.acquire(HOST))
+        await settle()
+        assert limiter.queue_depth(HOST) == 1
+
+        waiter.cancel()
+        await settle()
+        assert limiter.queue_depth(HOST) == 0
+
+        limiter.release(HOST)
+        assert limiter.in_flight(HOST) == 0
+
+    asyncio.run(run())
+
+
+def test_slot_handed_off_when_waiter_cancelled_after_grant():
+    limiter = _HostLimiter({HOST: 1})
+
+    async def run():
+        await limiter.acquire(HOST)
+        first = asyncio.ensure_future(limiter.acquire(HOST))
+        second = asyncio.ensure_future(limiter.acquire(HOST))
+        await settle()
+
+        # 슬롯을 넘겨받았지만 깨어나기 전에 취소된 경우, 다음 대기 요청이 슬롯을 받아야 합니다.
+        limiter.release(HOST)
+        first.cancel()
+        await settle()
+
+        assert first.cancelled()
+        assert second.done() and not second.cancelled()
+        assert limiter.in_flight(HOST) == 1 and limiter.queue_depth(HOST) == 0
+
+        limiter.release(HOST)
+        assert limiter.in_flight(HOST) == 0
+
+    asyncio.run(run())
+
+
+def test_new_request_does_not_overtake_waiter():
+    limiter = _HostLimiter({HOST: 1})
+    order = []
+
+    async def request(name):
+        await limiter.acquire(HOST)
+        order.append(name)
+
+    async def run():
+        await limiter.acquire(HOST)
+        waiter = asyncio.ensure_future(request("waiter"))
+        await settle()
+
+        limiter.release(HOST)
+        late = asyncio.ensure_future(request("late"))
+        await settle()
+
+        assert order == ["waiter"]
+        limiter.release(HOST)
+        await asyncio.gather(waiter, late)
+
+    asyncio.run(run())
+
+    assert order == ["waiter", "late"]
+
+
+def test_release_between_cancel_and_wakeup_keeps_cancelled_error():
+    limiter = _HostLimiter({HOST: 1})
+
+    async def run():
+        await limiter.acquire(HOST)
+        waiter = asyncio.ensure_future(limiter.acquire(HOST))
+        await settle()
+
+        # 취소된 대기 요청이 깨어나기 전에 release()가 큐에서 먼저 꺼내는 경우
+        waiter.cancel()
+        limiter.release(HOST)
+
+        try:
+            await waiter
+
+        except asyncio.CancelledError:
+            pass
+
+        assert limiter.in_flight(HOST) == 0 and limiter.queue_depth(HOST) == 0
+
+    asyncio.run(run())
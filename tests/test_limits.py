@@ -0,0 +1,124 @@
+import asyncio
+import math
+
+import pytest
+
+from pass_nice.exceptions import RateLimitError
+from pass_nice.limits import RateLimit, RateLimiter, _TokenBucket
+
+HOST = "nice.checkplus.co.kr"
+
+
+@pytest.mark.parametrize("rate, burst", [(0, None), (-1, None), (math.nan, None), (1, 0), (1, 0.5)])
+def test_rate_limit_rejects_invalid_values(rate, burst):
+    with pytest.raises(ValueError):
+        RateLimit(rate, burst=burst)
+
+
+def test_rate_limit_capacity():
+    assert RateLimit(0.5).capacity == 1.0
+    assert RateLimit(10).capacity == 10.0
+    assert RateLimit(10, burst=3).capacity == 3.0
+
+
+def test_token_bucket_refills_at_rate():
+    bucket = _TokenBucket(RateLimit(2, burst=2))
+    start = bucket.updated_at
+
+    for _ in range(2):
+        assert bucket.wait_time(start) == 0.0
+        bucket.tokens -= 1
+
+    assert bucket.wait_time(start) == pytest.approx(0.5)
+    assert bucket.wait_time(start + 0.25) == pytest.approx(0.25)
+    assert bucket.wait_time(start + 10) == 0.0
+    assert bucket.tokens == 2  # capacity 이상으로 쌓이지 않습니다.
+
+
+def test_fail_policy_rejects_without_consuming_tokens():
+    limiter = RateLimiter(host_limits={HOST: RateLimit(1, burst=1)}, policy="fail")
+
+    async def run():
+        await limiter.acquire(HOST, "/cert/main/menu")
+
+        with pytest.raises(RateLimitError) as info:
+            await limiter.acquire(HOST, "/cert/main/menu")
+
+        return info.value
+
+    error = asyncio.run(run())
+
+    assert 0 < error.retry_after <= 1
+    assert limiter._host_buckets[HOST].tokens == pytest.approx(0, abs=0.01)
+
+
+def test_wait_policy_spaces_requests_in_order():
+    limiter = RateLimiter(endpoint_limits={"/cert/": RateLimit(50, burst=1)})
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        finished = []
+
+        async def request(index):
+            await limiter.acquire(HOST, "/cert/polling/confirm/check/proc")
+            finished.append((index, loop.time() - start))
+
+        await asyncio.gather(*(request(index) for index in range(4)))
+        return finished
+
+    finished = asyncio.run(run())
+
+    assert [index for index, _ in finished] == [0, 1, 2, 3]
+    assert finished[-1][1] >= 3 / 50 * 0.9
+
+
+def test_max_wait_exceeded_raises():
+    limiter = RateLimiter(host_limits={HOST: RateLimit(1, burst=1)}, max_wait=0.1)
+
+    async def run():
+        await limiter.acquire(HOST, "/")
+
+        with pytest.raises(RateLimitError):
+            await limiter.acquire(HOST, "/")
+
+    asyncio.run(run())
+
+
+def test_longest_endpoint_prefix_applies():
+    limiter = RateLimiter(
+        endpoint_limits={"/cert/": RateLimit(1, burst=1), "/cert/captcha/": RateLimit(100, burst=100)},
+        policy="fail"
+    )
+
+    async def run():
+        for _ in range(10):
+            await limiter.acquire(HOST, "/cert/captcha/image/1")
+
+        await limiter.acquire(HOST, "/cert/main/menu")
+
+        with pytest.raises(RateLimitError):
+            await limiter.acquire(HOST, "/cert/main/menu")
+
+    asyncio.run(run())
+
+
+def test_cancelled_wait_returns_reserved_tokens():
+    limiter = RateLimiter(host_limits={HOST: RateLimit(10, burst=1)})
+    bucket = limiter._host_buckets[HOST]
+
+    async def run():
+        await limiter.acquire(HOST, "/")
+
+        waiters = [asyncio.ensure_future(limiter.acquire(HOST, "/")) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert bucket.tokens == pytest.approx(-5, abs=0.1)
+
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+
+        # 취소된 예약이 남아 있지 않으므로, 다음 요청은 토큰 1개가 채워지는 시간만 기다립니다.
+        assert bucket.wait_time(bucket.updated_at) == pytest.approx(0.1, abs=0.02)
+
+    asyncio.run(run())
@@ -0,0 +1,123 @@
+import asyncio
+
+import httpx
+import pytest
+
+from pass_nice import PASS_NICE
+from pass_nice.exceptions import ParseError
+
+
+class ChunkedBody(httpx.AsyncByteStream):
+    """본문을 지정한 크기로 나눠 전달하고, 전달한 청크 수를 기록합니다."""
+
+    def __init__(self, body: bytes, chunk_size: int):
+        self.body = body
+        self.chunk_size = chunk_size
+        self.sent = 0
+
+    async def __aiter__(self):
+        for start in range(0, len(self.body), self.chunk_size):
+            self.sent += 1
+            yield self.body[start:start + self.chunk_size]
+
+
+def request_fields(body: bytes, chunk_size: int, field_names, parse_type="const", charset="utf-8"):
+    stream = ChunkedBody(body, chunk_size)
+
+    def handler(request):
+        return httpx.Response(200, stream=stream, headers={"content-type": f"text/html; charset={charset}"})
+
+    async def run():
+        session = PASS_NICE(transport=httpx.MockTransport(handler))
+        try:
+            return await session._request_fields("GET", "https://nice.checkplus.co.kr/", field_names, parse_type)
+
+        finally:
+            await session.close()
+
+    return asyncio.run(run()), stream
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 4096])
+def test_fields_split_across_chunks(chunk_size):
+    body = b"x" * 100 + b'const SERVICE_INFO = "ABC";' + b" const captchaVersion =\n \"CAP1\";" + b"y" * 100
+
+    values, _ = request_fields(body, chunk_size, ("SERVICE_INFO", "captchaVersion"))
+
+    assert values == {"SERVICE_INFO": "ABC", "captchaVersion": "CAP1"}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 4096])
+def test_prefix_retained_after_unrelated_matches(chunk_size):
+    # 같은 접두사("const")로 시작하는 다른 선언 뒤에 실제 필드가 청크 경계에 걸쳐 있는 경우
+    body = b'const other = 1; const SERVICE_INFO = "A"; ' + b"z" * 50 + b'const queryString = "Q=1";'
+
+    values, _ = request_fields(body, chunk_size, ("SERVICE_INFO", "queryString"))
+
+    assert values == {"SERVICE_INFO": "A", "queryString": "Q=1"}
+
+
+def test_first_value_wins():
+    body = b'const SERVICE_INFO = "FIRST"; const SERVICE_INFO = "SECOND";'
+
+    values, _ = request_fields(body, 4, ("SERVICE_INFO",))
+
+    assert values == {"SERVICE_INFO": "FIRST"}
+
+
+def test_stops_reading_large_remainder_after_all_fields_found():
+    body = b'const SERVICE_INFO = "ABC";' + b"y" * 1024 * 1024
+
+    values, stream = request_fields(body, 4096, ("SERVICE_INFO",))
+
+    assert values == {"SERVICE_INFO": "ABC"}
+    assert stream.sent < len(body) // 4096 // 4
+
+
+def test_drains_small_remainder_after_all_fields_found():
+    # 남은 본문이 작으면 끝까지 읽어 연결을 커넥션 풀에 반환할 수 있도록 합니다.
+    body = b'const SERVICE_INFO = "ABC";' + b"y" * 10_000
+
+    values, stream = request_fields(body, 1024, ("SERVICE_INFO",))
+
+    assert values == {"SERVICE_INFO": "ABC"}
+    assert stream.sent == -(-len(body) // 1024)
+
+
+def test_field_after_large_unmatched_prefix():
+    body = b"<input" + b"x" * 100_000 + b'<input type="hidden" name="certInfoHash" value="HASH">'
+
+    values, _ = request_fields(body, 4096, ("certInfoHash",), "input")
+
+    assert values == {"certInfoHash": "HASH"}
+
+
+def test_non_ascii_value_decoded_with_response_charset():
+    body = "form1.NICE_NAME.value = '홍길동';".encode("euc-kr")
+
+    values, _ = request_fields(body, 3, ("NICE_NAME",), "form", charset="euc-kr")
+
+    assert values == {"NICE_NAME": "홍길동"}
+
+
+def test_missing_fields_listed_in_parse_error():
+    body = b'const SERVICE_INFO = "ABC";'
+
+    with pytest.raises(ParseError, match="captchaVersion, queryString"):
+        request_fields(body, 8, ("captchaVersion", "SERVICE_INFO", "queryString"))
+
+
+def test_discard_stops_reading_large_body():
+    stream = ChunkedBody(b"x" * 1024 * 1024, 4096)
+
+    async def run():
+        session = PASS_NICE(transport=httpx.MockTransport(lambda request: httpx.Response(200, stream=stream)))
+        try:
+            await session._request_discard("GET", "https://nice.checkplus.co.kr/cert/main/menu")
+
+        finally:
+            await session.close()
+
+    asyncio.run(run())
+
+    assert stream.sent < 1024 * 1024 // 4096
@@ -0,0 +1,151 @@
+import asyncio
+
+import pytest
+
+from pass_nice import PollingScheduler, PollingStrategy
+
+FAST = PollingStrategy(initial_interval=0.01, max_interval=0.01, jitter=0)
+
+
+def test_completed_session_resolves_future(nice, push_session):
+    nice.confirm_after = 3
+
+    async def run():
+        session = await push_session()
+        async with PollingScheduler(FAST) as scheduler:
+            return await asyncio.wait_for(scheduler.add(session, deadline=5.0), 5.0)
+
+    result = asyncio.run(run())
+
+    assert result.status
+    assert result.data.name == "홍길동"
+    assert nice.calls["/cert/polling/confirm/check/proc"] == 3
+
+
+def test_deadline_resolves_with_failed_result(nice, push_session):
+    nice.confirm_after = None
+
+    async def run():
+        session = await push_session()
+        events = []
+        session._event_queues.append(queue := asyncio.Queue())
+
+        async with PollingScheduler(FAST) as scheduler:
+            result = await asyncio.wait_for(scheduler.add(session, deadline=0.05), 5.0)
+
+        while not queue.empty():
+            events.append(queue.get_nowait().type)
+
+        return result, events
+
+    result, events = asyncio.run(run())
+
+    assert not result.status
+    assert "expired" in events
+
+
+def test_network_error_is_retried(nice, push_session):
+    nice.fail_paths = {"/cert/polling/confirm/check/proc"}
+    nice.fail_times = 2
+    nice.confirm_after = 3
+
+    async def run():
+        session = await push_session()
+        async with PollingScheduler(FAST) as scheduler:
+            return await asyncio.wait_for(scheduler.add(session, deadline=5.0), 5.0)
+
+    assert asyncio.run(run()).status
+
+
+def test_close_cancels_future_of_in_flight_poll(nice, push_session):
+    nice.confirm_after = None
+    nice.check_delay = 10.0
+
+    async def run():
+        session = await push_session()
+        scheduler = PollingScheduler(FAST)
+        future = scheduler.add(session, deadline=30.0)
+
+        # 확인 요청이 전송되어 응답을 기다리는 중에 종료합니다.
+        while not scheduler._in_flight:
+            await asyncio.sleep(0.005)
+
+        await scheduler.close()
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(future, 1.0)
+
+        assert scheduler.pending == 0
+
+    asyncio.run(run())
+
+
+def test_close_cancels_future_of_queued_session(nice, push_session):
+    nice.confirm_after = None
+
+    async def run():
+        session = await push_session()
+        scheduler = PollingScheduler(PollingStrategy(initial_interval=10.0, jitter=0))
+        future = scheduler.add(session, deadline=30.0)
+
+        await scheduler.close()
+
+        assert future.cancelled()
+
+    asyncio.run(run())
+
+
+def test_wait_for_push_verification_retries_network_error(nice, push_session):
+    nice.fail_paths = {"/cert/polling/confirm/check/proc"}
+    nice.fail_times = 2
+    nice.confirm_after = 3
+
+    async def run():
+        session = await push_session()
+        try:
+            return await asyncio.wait_for(session.wait_for_push_verification(5.0, FAST), 5.0)
+
+        finally:
+            await session.close()
+
+    result = asyncio.run(run())
+
+    assert result.status
+    assert nice.calls["/cert/polling/confirm/check/proc"] == 3
+
+
+def test_wait_for_push_verification_expires_on_persistent_network_error(nice, push_session):
+    nice.fail_paths = {"/cert/polling/confirm/check/proc"}
+
+    async def run():
+        session = await push_session()
+        try:
+            return await asyncio.wait_for(session.wait_for_push_verification(0.05, FAST), 5.0)
+
+        finally:
+            await session.close()
+
+    assert not asyncio.run(run()).status
+
+
+def test_close_cancels_future_waiting_for_in_flight_slot(nice, push_session):
+    nice.confirm_after = None
+    nice.check_delay = 10.0
+
+    async def run():
+        first, second = await push_session(), await push_session()
+        scheduler = PollingScheduler(FAST, max_in_flight=1)
+        futures = [scheduler.add(first, deadline=30.0), scheduler.add(second, deadline=30.0)]
+
+        # 첫 번째 세션이 슬롯을 점유하고, 두 번째 세션은 슬롯을 기다리는 중에 종료합니다.
+        while not scheduler._in_flight:
+            await asyncio.sleep(0.005)
+        await asyncio.sleep(0.05)
+
+        await scheduler.close()
+
+        for future in futures:
+            with pytest.raises(asyncio.CancelledError):
+                await asyncio.wait_for(future, 1.0)
+
+    asyncio.run(run())
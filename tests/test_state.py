@@ -0,0 +1,46 @@
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+
+from pass_nice import PASS_NICE
+from pass_nice.exceptions import ParseError
+
+
+def make_state(verification_data, cookies):
+    state = ["SK", "app_push", True, True, True, "SVC", "HASH", "CAP", None, verification_data, cookies]
+    return bytes([1]) + json.dumps(state).encode("utf-8")
+
+
+def test_round_trip_restores_session():
+    state = make_state(
+        ["홍길동", "20000101", "1", "01012345678", "SK"],
+        [["JSESSIONID", "SESSION", "nice.checkplus.co.kr", "/"]]
+    )
+
+    restored = PASS_NICE.from_state(state)
+
+    assert restored._verification_data.birthdate == datetime(2000, 1, 1)
+    assert restored._cookies.get("JSESSIONID") == "SESSION"
+    assert json.loads(restored.export_state()[1:]) == json.loads(state[1:])
+
+    asyncio.run(restored.close())
+
+
+@pytest.mark.parametrize("verification_data, cookies", [
+    (["홍길동", "20000101", "1"], []),                               # 필드 개수 불일치
+    ("홍길동", []),                                                  # 목록이 아닌 값
+    (["홍길동", "2000-01-01", "1", "01012345678", "SK"], []),        # 생년월일 형식
+    (None, [["JSESSIONID", "SESSION"]]),                            # 쿠키 필드 개수 불일치
+    (None, 1),                                                      # 목록이 아닌 쿠키
+])
+def test_malformed_state_raises_parse_error(verification_data, cookies):
+    with pytest.raises(ParseError):
+        PASS_NICE.from_state(make_state(verification_data, cookies))
+
+
+@pytest.mark.parametrize("state", [b"", b"\x02[]", b"\x01not json", b"\x01[1, 2]"])
+def test_unsupported_state_raises_parse_error(state):
+    with pytest.raises(ParseError):
+        PASS_NICE.from_state(state)
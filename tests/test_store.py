@@ -0,0 +1,160 @@
+import asyncio
+
+import httpx
+import pytest
+
+from pass_nice import store as store_module
+from pass_nice.store import MemorySessionStore, SessionManager, SQLiteSessionStore
+from pass_nice.transport import _create_cookieless_jar
+
+
+class FakeClock:
+    """store 모듈의 time을 대신하는 시계 (monotonic, time 모두 같은 값을 반환합니다.)"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(store_module, "time", clock)
+    return clock
+
+
+def test_memory_put_get_expire(clock):
+    async def run():
+        store = MemorySessionStore()
+        await store.put("a", b"A")
+
+        assert await store.get("a") == b"A"
+        assert await store.get("missing") is None
+
+        await store.expire("a")
+        assert await store.get("a") is None
+        assert len(store) == 0
+
+    asyncio.run(run())
+
+
+def test_memory_ttl_expiry(clock):
+    async def run():
+        store = MemorySessionStore(default_ttl=10)
+        await store.put("a", b"A")
+        await store.put("b", b"B", ttl=100)
+
+        clock.now += 10
+        assert await store.get("a") is None
+        assert await store.get("b") == b"B"
+
+        clock.now += 90
+        assert await store.evict_expired() == 1
+        assert len(store) == 0
+
+    asyncio.run(run())
+
+
+def test_memory_lru_eviction_at_max_size(clock):
+    async def run():
+        store = MemorySessionStore(max_size=2)
+        await store.put("a", b"A")
+        await store.put("b", b"B")
+
+        # 최근에 사용한 a는 남고, 가장 오래 사용되지 않은 b가 삭제됩니다.
+        assert await store.get("a") == b"A"
+        await store.put("c", b"C")
+
+        assert len(store) == 2
+        assert await store.get("b") is None
+        assert await store.get("a") == b"A" and await store.get("c") == b"C"
+
+    asyncio.run(run())
+
+
+def test_memory_overwrite_ignores_stale_expiry(clock):
+    async def run():
+        store = MemorySessionStore(default_ttl=10)
+        await store.put("a", b"OLD")
+        await store.put("a", b"NEW", ttl=100)
+
+        # 덮어쓰기 전 만료 시각의 힙 항목이 새 세션을 삭제하지 않아야 합니다.
+        clock.now += 50
+        assert await store.evict_expired() == 0
+        assert await store.get("a") == b"NEW"
+
+        clock.now += 50
+        assert await store.evict_expired() == 1
+
+    asyncio.run(run())
+
+
+def test_memory_expiry_heap_rebuilt_after_evictions(clock):
+    async def run():
+        store = MemorySessionStore(max_size=1)
+        for index in range(5000):
+            await store.put(str(index), b"S")
+
+        assert len(store) == 1
+        assert len(store._expiry_heap) <= 2 * len(store) + 1024 + 1
+        assert await store.get("4999") == b"S"
+
+    asyncio.run(run())
+
+
+def test_sqlite_ttl_and_eviction(clock, tmp_path):
+    async def run():
+        store = SQLiteSessionStore(str(tmp_path / "sessions.db"), default_ttl=10)
+        try:
+            await store.put("a", b"A")
+            await store.put("b", b"B", ttl=100)
+            await store.put("a", b"A2")
+
+            assert await store.get("a") == b"A2"
+
+            clock.now += 10
+            assert await store.get("a") is None
+            assert await store.evict_expired() == 1
+            assert await store.get("b") == b"B"
+
+            await store.expire("b")
+            assert await store.get("b") is None
+
+        finally:
+            await store.close()
+
+    asyncio.run(run())
+
+
+def test_session_manager_sqlite_round_trip(nice, push_session, tmp_path):
+    path = str(tmp_path / "sessions.db")
+
+    async def run():
+        session = await push_session()
+        state = session.export_state()
+        await session.close()
+
+        async with SessionManager(SQLiteSessionStore(path)) as manager:
+            session_id = await manager.put(session)
+
+        # 다른 워커처럼 새 관리자로 복원한 뒤 인증을 이어서 진행합니다.
+        client = httpx.AsyncClient(transport=nice.transport, cookies=_create_cookieless_jar())
+        async with SessionManager(SQLiteSessionStore(path), client=client) as manager:
+            restored = await manager.get(session_id)
+            assert restored is not None
+            assert restored.export_state() == state
+
+            result = await restored.check_push_verification()
+
+            await manager.expire(session_id)
+            assert await manager.get(session_id) is None
+
+        await client.aclose()
+        return result
+
+    assert asyncio.run(run()).status
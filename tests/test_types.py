@@ -0,0 +1,44 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from pass_nice import VerificationData
+from pass_nice.exceptions import ParseError
+from pass_nice.types import _check_birthdate
+
+from conftest import DECRYPT_PAGE
+
+
+@pytest.mark.parametrize("value", ["20000101", "20000229", "19991231"])
+def test_check_birthdate_accepts_real_dates(value):
+    assert _check_birthdate(value) == value
+
+
+@pytest.mark.parametrize("value", ["000101", "2000-01-01", "２００００１０１", "20001301", "19000229", "20000431", "00000101"])
+def test_check_birthdate_rejects_malformed_dates(value):
+    with pytest.raises(ParseError):
+        _check_birthdate(value)
+
+
+def test_birthdate_parsed_lazily():
+    data = VerificationData("홍길동", "20000229", "1", "01012345678", "SK")  # type: ignore
+
+    assert repr(data) == repr(VerificationData("홍길동", datetime(2000, 2, 29), "1", "01012345678", "SK"))
+    assert hash(data) == hash(VerificationData("홍길동", "20000229", "1", "01012345678", "SK"))  # type: ignore
+    assert data.birthdate == datetime(2000, 2, 29)
+
+
+def test_malformed_birthdate_from_nice_raises_parse_error(nice, push_session):
+    nice.decrypt_page = DECRYPT_PAGE.replace("20000101", "2000011")
+
+    async def run():
+        session = await push_session()
+        try:
+            return await session.check_push_verification()
+
+        finally:
+            await session.close()
+
+    with pytest.raises(ParseError):
+        asyncio.run(run())
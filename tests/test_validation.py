@@ -0,0 +1,77 @@
+import pytest
+
+from pass_nice import validate_many
+from pass_nice.validation import _FIELD_VALIDATORS
+
+
+def test_record_fields_are_union_of_all_rows():
+    result = validate_many([
+        {"name": "홍길동"},
+        {"name": "홍길동", "phone_number": "010-1234-5678"},
+        {"name": "홍길동", "phone_number": "0101234"},
+    ])
+
+    assert set(result.values) == {"name", "phone_number"}
+    assert result.values["phone_number"] == [None, "01012345678", None]
+    assert result.invalid_indices() == [0, 2]
+    assert result.errors[0] == (("phone_number", _FIELD_VALIDATORS["phone_number"][1]),)
+
+
+def test_explicit_fields_require_missing_values():
+    result = validate_many([{"name": "홍길동"}, {"name": "홍길동", "sms_code": "123456"}], fields=["sms_code"])
+
+    assert set(result.values) == {"sms_code"}
+    assert result.valid == [False, True]
+
+
+def test_explicit_fields_for_columns():
+    result = validate_many({"name": ["홍길동", "X"], "phone_number": ["01012345678", "0"]}, fields=["name", "gender"])
+
+    assert set(result.values) == {"name", "gender"}
+    assert result.values["gender"] == [None, None]
+    assert result.invalid_count == 2
+
+
+def test_unknown_field_rejected():
+    with pytest.raises(ValueError, match="email"):
+        validate_many([], fields=["name", "email"])
+
+
+def test_column_lengths_must_match():
+    with pytest.raises(ValueError):
+        validate_many({"name": ["홍길동"], "gender": ["1", "2"]})
+
+
+@pytest.mark.parametrize("birthdate, gender, expected", [
+    ("000101", "3", "000101"),    # 2000년대
+    ("990101", "1", "990101"),
+    ("20000101", "1", None),      # 출생 세기 불일치
+    ("000229", "3", "000229"),    # 2000년 2월 29일
+    ("000229", "1", None),        # 1900년 2월 29일은 없음
+    ("990230", "1", None),        # 존재하지 않는 날짜
+])
+def test_birthdate_checked_against_gender_century(birthdate, gender, expected):
+    result = validate_many({"birthdate": [birthdate], "gender": [gender]})
+
+    assert result.values["birthdate"] == [expected]
+    assert result.valid == [expected is not None]
+
+
+def test_values_normalized_to_nice_format():
+    result = validate_many([{"name": " 홍길동 ", "birthdate": "19990101", "phone_number": "01012345678"}])
+
+    assert result.values == {"name": ["홍길동"], "birthdate": ["990101"], "phone_number": ["01012345678"]}
+    assert result.errors == [()]
+
+
+def test_missing_requested_column_counts_all_records():
+    result = validate_many({"name": ["홍길동", "홍길동", "홍길동"]}, fields=["phone_number"])
+
+    assert len(result) == 3
+    assert result.values["phone_number"] == [None, None, None]
+    assert result.invalid_indices() == [0, 1, 2]
+
+
+def test_unvalidated_column_lengths_must_match():
+    with pytest.raises(ValueError):
+        validate_many({"name": ["홍길동"], "email": ["a@b.c", "d@e.f"]})